@@ -3,7 +3,8 @@ Supabase client for movie data storage and retrieval.
 """
 import os
 import logging
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 from supabase import create_client, Client
 from dotenv import load_dotenv, find_dotenv
@@ -13,6 +14,35 @@ load_dotenv(find_dotenv())
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of values sent in a single `in` filter (keeps request URLs short)
+IN_FILTER_CHUNK_SIZE = 50
+
+# Rows fetched per request when reading a whole table (PostgREST caps responses at 1000 rows by default)
+PAGE_SIZE = 1000
+
+
+def _in_filter_list(values: List[str]) -> str:
+    """
+    Format values as a PostgREST `in` list, quoting and escaping every value.
+    
+    postgrest-py's in_() only quotes values with reserved characters and never escapes
+    an embedded double quote, so a title containing one would break the whole filter.
+    
+    Args:
+        values: String values
+        
+    Returns:
+        List literal such as ("a","b \\"c\\"")
+    """
+    quoted = ('"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"' for value in values)
+    return f"({','.join(quoted)})"
+
+
+@lru_cache(maxsize=None)
+def _shared_client(url: str, key: str) -> Client:
+    """Create one Supabase client per project and key, so its HTTP connections are reused"""
+    return create_client(url, key)
+
 
 class SupabaseClient:
     """Client for interacting with Supabase database."""
@@ -26,7 +56,8 @@ class SupabaseClient:
         if not self.url or not self.key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
         
-        self.client: Client = create_client(self.url, self.key)
+        # Share the underlying client (and its keep-alive connection pool) across instances
+        self.client: Client = _shared_client(self.url, self.key)
     
     def _get_table(self, table_name: str):
         """Get table reference with schema."""
@@ -49,6 +80,56 @@ class SupabaseClient:
             logger.error(f"Error checking if movie exists {name}: {e}")
             return False
     
+    def _existing_names(self, table_name: str, names: List[str]) -> Set[str]:
+        """
+        Return the subset of names that already exist in a table.
+        
+        A chunk whose batched lookup fails is checked one name at a time; a name that
+        cannot be checked at all is reported as existing, so it is skipped rather than
+        inserted twice (the next run checks it again).
+        
+        Args:
+            table_name: Table to check
+            names: Names to look up
+        
+        Returns:
+            Set of names found in the table (or that could not be checked)
+        """
+        existing = set()
+        unique_names = list(dict.fromkeys(names))
+        
+        for start in range(0, len(unique_names), IN_FILTER_CHUNK_SIZE):
+            chunk = unique_names[start:start + IN_FILTER_CHUNK_SIZE]
+            try:
+                response = self._get_table(table_name).select('name').filter('name', 'in', _in_filter_list(chunk)).execute()
+                existing.update(row['name'] for row in response.data)
+                continue
+            except Exception as e:
+                logger.warning(f"Batched name lookup in {table_name} failed, checking {len(chunk)} names individually: {e}")
+            
+            for name in chunk:
+                try:
+                    response = self._get_table(table_name).select('id').eq('name', name).limit(1).execute()
+                    if response.data:
+                        existing.add(name)
+                except Exception as e:
+                    logger.error(f"Error checking if {name} exists in {table_name}, treating it as existing: {e}")
+                    existing.add(name)
+        
+        return existing
+    
+    def existing_movie_names(self, names: List[str]) -> Set[str]:
+        """
+        Check which movies already exist in the database using batched exact name matches.
+        
+        Args:
+            names: Movie names to check
+        
+        Returns:
+            Set of movie names that already exist (names that could not be checked are included)
+        """
+        return self._existing_names('movies', names)
+    
     def cinema_exists(self, name: str) -> bool:
         """
         Check if a cinema exists in the database using exact name match.
@@ -92,6 +173,116 @@ class SupabaseClient:
             logger.error(f"Error checking if showtime exists (movie: {movie_id}, cinema: {cinema_id}, time: {showtime}, lang: {language}): {e}")
             return False
     
+    def existing_showtimes(self, cinema_id: str, showtimes: List[str]) -> Set[Tuple[str, datetime, str]]:
+        """
+        Get the showtimes of a cinema that already exist at the given times, with batched queries.
+        
+        Args:
+            cinema_id: Cinema ID to check
+            showtimes: Showtime timestamps to look up
+            
+        Returns:
+            Set of (movie_id, showtime, language) keys, with showtime as a naive datetime
+            in the database session's time zone (empty set on error)
+        """
+        try:
+            existing = set()
+            unique_showtimes = list(dict.fromkeys(showtimes))
+            
+            for start in range(0, len(unique_showtimes), IN_FILTER_CHUNK_SIZE):
+                chunk = unique_showtimes[start:start + IN_FILTER_CHUNK_SIZE]
+                response = (self._get_table('showtimes')
+                           .select('movie_id, showtime, language')
+                           .eq('cinema_id', cinema_id)
+                           .in_('showtime', chunk)
+                           .execute())
+                existing.update(
+                    (row['movie_id'], datetime.fromisoformat(row['showtime']).replace(tzinfo=None), row['language'])
+                    for row in response.data
+                )
+            
+            return existing
+        except Exception as e:
+            logger.error(f"Error checking existing showtimes for cinema {cinema_id}: {e}")
+            return set()
+    
+    def get_upcoming_showtimes(self, since: str) -> Optional[Set[Tuple[str, str, datetime, str]]]:
+        """
+        Get the keys of all showtimes from a point in time on, a page at a time.
+        
+        Args:
+            since: Earliest showtime to include (ISO date or timestamp)
+            
+        Returns:
+            Set of (cinema_id, movie_id, showtime, language) keys, with showtime as a naive
+            datetime in the database session's time zone, or None on error
+        """
+        try:
+            showtimes = set()
+            start = 0
+            while True:
+                response = (self._get_table('showtimes')
+                           .select('cinema_id, movie_id, showtime, language')
+                           .gte('showtime', since)
+                           .order('id')
+                           .range(start, start + PAGE_SIZE - 1)
+                           .execute())
+                showtimes.update(
+                    (row['cinema_id'], row['movie_id'], datetime.fromisoformat(row['showtime']).replace(tzinfo=None), row['language'])
+                    for row in response.data
+                )
+                if len(response.data) < PAGE_SIZE:
+                    return showtimes
+                start += PAGE_SIZE
+        except Exception as e:
+            logger.error(f"Error getting showtimes since {since}: {e}")
+            return None
+    
+    def _ids_by_name(self, table_name: str) -> Dict[str, str]:
+        """
+        Read the name and ID of every row of a table, a page at a time.
+        
+        Args:
+            table_name: Table to read
+            
+        Returns:
+            Dictionary mapping names to IDs
+        """
+        ids = {}
+        start = 0
+        while True:
+            response = self._get_table(table_name).select('id, name').order('id').range(start, start + PAGE_SIZE - 1).execute()
+            ids.update((row['name'], row['id']) for row in response.data)
+            if len(response.data) < PAGE_SIZE:
+                return ids
+            start += PAGE_SIZE
+    
+    def get_movie_ids(self) -> Dict[str, str]:
+        """
+        Get the IDs of all movies, keyed by name.
+        
+        Returns:
+            Dictionary mapping movie names to IDs (empty on error)
+        """
+        try:
+            return self._ids_by_name('movies')
+        except Exception as e:
+            logger.error(f"Error fetching movie IDs: {e}")
+            return {}
+    
+    def get_cinema_ids(self) -> Dict[str, str]:
+        """
+        Get the IDs of all cinemas, keyed by name.
+        
+        Returns:
+            Dictionary mapping cinema names to IDs (empty on error)
+        """
+        try:
+            return self._ids_by_name('cinemas')
+        except Exception as e:
+            logger.error(f"Error fetching cinema IDs: {e}")
+            return {}
+    
     def get_movie_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Get movie by name from database.
@@ -178,6 +369,104 @@ class SupabaseClient:
             logger.error(f"Error adding cinema {cinema_data.get('name')}: {e}")
             return None
     
+    def _insert_rows(self, table_name: str, rows: List[Dict[str, Any]], on_conflict: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Insert rows with a single request.
+        
+        Args:
+            table_name: Table to insert into
+            rows: Row dictionaries to insert
+            on_conflict: Unique column; rows conflicting on it are skipped (ON CONFLICT DO NOTHING)
+            
+        Returns:
+            The inserted rows as stored in the database
+        """
+        # Add timestamp
+        created_at = datetime.now().isoformat()
+        for row in rows:
+            row['created_at'] = created_at
+        
+        table = self._get_table(table_name)
+        if on_conflict:
+            query = table.upsert(rows, on_conflict=on_conflict, ignore_duplicates=True)
+        else:
+            query = table.insert(rows)
+        
+        response = query.execute()
+        return response.data or []
+    
+    def _add_many(self, table_name: str, rows: List[Dict[str, Any]], on_conflict: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Insert rows with a single request, falling back to one insert per row on failure.
+        
+        Args:
+            table_name: Table to insert into
+            rows: Row dictionaries to insert
+            on_conflict: Unique column; rows conflicting on it are skipped (ON CONFLICT DO NOTHING)
+            
+        Returns:
+            The inserted rows as stored in the database
+        """
+        if not rows:
+            return []
+        
+        try:
+            inserted = self._insert_rows(table_name, rows, on_conflict)
+            logger.info(f"Successfully added {len(inserted)} of {len(rows)} rows to {table_name}")
+            return inserted
+            
+        except Exception as e:
+            # One bad row fails the whole request
+            logger.warning(f"Bulk insert of {len(rows)} rows into {table_name} failed, inserting individually: {e}")
+        
+        inserted = []
+        for row in rows:
+            try:
+                inserted.extend(self._insert_rows(table_name, [row], on_conflict))
+            except Exception as e:
+                logger.error(f"Error adding row {row.get('name')} to {table_name}: {e}")
+        return inserted
+    
+    def add_movies_bulk(self, movies_data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several movies to the database with one insert.
+        
+        Args:
+            movies_data: List of dictionaries containing movie information
+            
+        Returns:
+            IDs of the movies that were added
+        """
+        return [row['id'] for row in self._add_many('movies', movies_data)]
+    
+    def add_cinemas_bulk(self, cinemas_data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several cinemas to the database with one insert, skipping names that already exist.
+        
+        Args:
+            cinemas_data: List of dictionaries containing cinema information
+            
+        Returns:
+            IDs of the cinemas that were added (existing cinemas are not included)
+        """
+        return [row['id'] for row in self._add_many('cinemas', cinemas_data, on_conflict='name')]
+    
+    def add_showtimes_bulk(self, showtimes_data: List[Dict[str, Any]]) -> Set[Tuple[str, str, datetime, str]]:
+        """
+        Add several showtimes to the database with one insert.
+        
+        Args:
+            showtimes_data: List of dictionaries containing showtime information
+            
+        Returns:
+            Set of (cinema_id, movie_id, showtime, language) keys of the showtimes that were
+            added, in the same form as get_upcoming_showtimes
+        """
+        return {
+            (row['cinema_id'], row['movie_id'], datetime.fromisoformat(row['showtime']).replace(tzinfo=None), row['language'])
+            for row in self._add_many('showtimes', showtimes_data)
+        }
+    
     def add_showtime(self, showtime_data: Dict[str, Any]) -> Optional[str]:
         """
         Add a new showtime to the database.
@@ -41,9 +41,10 @@ def run_scraper():
         # Get configuration from environment
         scraper_delay = float(os.getenv('SCRAPER_DELAY', '2'))
         headless_mode = os.getenv('HEADLESS_MODE', 'false').lower() == 'true'
+        pool_size = int(os.getenv('SCRAPER_POOL_SIZE', '4'))
         
         # Initialize and test scraper using sync wrapper
-        with MovieScraperSync(headless=headless_mode, delay=scraper_delay) as scraper:
+        with MovieScraperSync(headless=headless_mode, delay=scraper_delay, pool_size=pool_size) as scraper:
             logger.info("Scraper initialized successfully")
             
             # Test navigation to homepage with retry logic
@@ -2,38 +2,933 @@
 Movie scraper for extracting movie data from hkmovie6.com using Zendriver
 """
 import os
+import atexit
 import logging
+import threading
 import time
 import asyncio
 import csv
-from typing import Dict, List, Optional, Union, Tuple
+import json
+import itertools
+import random
+import re
+from typing import Dict, List, Optional, Set, Union, Tuple
 from datetime import datetime, date
+from functools import cached_property
 import zendriver as zd
 
 from db.supabase_client import SupabaseClient
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for CSV output files (one large write instead of many small ones)
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Detail output rows are checkpoint-flushed every this many rows, and written at most this many per call
+CSV_FLUSH_EVERY = 100
+CSV_WRITE_BATCH_SIZE = 64
+
+# Translation table used to make scraped text safe for pipe-delimited CSV
+CSV_SANITIZE_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' ', '|': '｜'})
+
+# Characters that make csv.writer (QUOTE_MINIMAL) quote a pipe-delimited field
+CSV_QUOTE_PATTERN = re.compile(r'[|"\r\n]')
+
+# Date button text in day/month format, e.g. "15/12" or " 5/1 "
+DATE_TEXT_PATTERN = re.compile(r'\s*(\d{1,2})\s*/\s*(\d{1,2})\s*')
+
+# Error messages that mean the browser connection is gone and needs a restart
+CONNECTION_ERROR_PATTERN = re.compile('|'.join(map(re.escape, (
+    'connect call failed',  # Errno 111
+    'connection refused',   # Connection refused
+    'connection reset',     # Connection reset by peer
+    'broken pipe',          # Broken pipe
+    'target closed',        # Browser/page closed
+    'session not created',  # Browser session issues
+    'chrome not reachable', # Chrome unreachable
+    'no such session',      # Session lost
+    'invalid session id',   # Invalid session
+))), re.IGNORECASE)
+
+# Retry settings for transient navigation/evaluate failures (exponential backoff with jitter)
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+# Number of input CSV rows read (and checked against the database) at a time
+INPUT_BATCH_SIZE = 50
+
+# Attempts at a movie or cinema detail page before giving up on it, with exponential backoff in between.
+# This is the only retry layer for detail pages: their navigations and evaluates are not retried on their own.
+DETAIL_RETRY_ATTEMPTS = 3
+DETAIL_RETRY_BASE_DELAY = 2.0
+DETAIL_RETRY_MAX_DELAY = 30.0
+
+# Number of scraped movies/cinemas inserted into the database per request
+DB_INSERT_BATCH_SIZE = 32
+
+# Capacity of the queues between the scrape, database and CSV stages
+STAGE_QUEUE_SIZE = 100
+
+# Default number of tabs (one worker each, so also the page requests in flight) used for concurrent scraping
+MAX_CONCURRENT_REQUESTS = 4
+
+# Maximum number of blank tabs kept open per browser for reuse (raised to pool_size + 1 for larger pools)
+MAX_FREE_TABS = 8
+
+# Chrome options for zendriver - using only supported flags
+BROWSER_ARGS: Tuple[str, ...] = (
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    # "--disable-blink-features=AutomationControlled",
+)
+
+# Environment settings read once at import (the db client has already loaded .env)
+NO_SANDBOX = os.getenv('NO_SANDBOX', 'false').lower() in ('true', '1', 'yes', 'on')
+SCRAPER_TIMEOUT = float(os.getenv('SCRAPER_TIMEOUT', '60'))
+SCRAPER_RATE_LIMIT = float(os.getenv('SCRAPER_RATE_LIMIT', '4'))
+BROWSER_POOL_MIN_IDLE = int(os.getenv('BROWSER_POOL_MIN_IDLE', '0'))
+BROWSER_POOL_MAX_IDLE = int(os.getenv('BROWSER_POOL_MAX_IDLE', '2'))
+BROWSER_POOL_MAX_IDLE_SECONDS = float(os.getenv('BROWSER_POOL_MAX_IDLE_SECONDS', '90000'))
+
+# Browser launches: each round starts one Chrome process, and a second one only if the first has not
+# connected after BROWSER_START_HEDGE_DELAY seconds. Launches are never cancelled; ones that lose or
+# outlive the round's timeout are stopped once they finish. Failed rounds are followed by the next backoff pause.
+BROWSER_START_HEDGE_DELAY = 8.0
+BROWSER_START_TIMEOUT = 20.0
+BROWSER_START_BACKOFF = (1.0, 2.0)
+BROWSER_START_ROUNDS = len(BROWSER_START_BACKOFF) + 1
+
+# Pooled browsers idle for less than this many seconds are reused without a CDP health check
+HEALTH_CHECK_IDLE_SECONDS = 30.0
+
+# URL patterns never loaded by the homepage tab: images, fonts, media and analytics.
+# Stylesheets are still loaded; dropdown extraction relies on computed visibility.
+# Worker tabs are left unblocked: blocking needs the CDP Network domain, whose events
+# Zendriver streams through its listener, delaying the idle wait of every navigation.
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*", "*facebook.net*",
+)
+
+# Columns of the detail CSV outputs (and keys of the scraped details dicts)
+MOVIE_DETAIL_COLUMNS = ('name', 'url', 'category', 'description')
+CINEMA_DETAIL_COLUMNS = ('name', 'url', 'address')
+
+# Fields reported for a page that could not be scraped, by failure kind
+MOVIE_FAILURE_DETAILS = {
+    'timeout': {'category': 'Timeout Error', 'description': 'Timeout error - browser restart failed'},
+    'connection': {'category': 'Connection Error', 'description': 'Connection error - browser restart failed'},
+    'error': {'category': 'Error', 'description': 'Error retrieving description'},
+}
+CINEMA_FAILURE_DETAILS = {
+    'timeout': {'address': 'Timeout error - browser restart failed'},
+    'connection': {'address': 'Connection error - browser restart failed'},
+    'error': {'address': 'Error retrieving address'},
+}
+
+# Key set to True in the details of a page that could not be scraped (never set on scraped details,
+# and not an output column, so it is not written to the CSV)
+FAILED_KEY = 'failed'
+
+# HTTP statuses that mean the site wants us to slow down
+RATE_LIMIT_STATUSES = (429, 503)
+
+# Maximum wait (seconds) to reset, close or health-check a tab or browser; these
+# are quick unless it has hung, which must not cost another full scraper timeout
+TAB_CLEANUP_TIMEOUT = 5.0
+
+# Language switch wait (seconds) and polling interval for in-page predicates
+LANG_SWITCH_TIMEOUT = 3.0
+PREDICATE_POLL_INTERVAL = 0.1
+
+# Maximum wait (seconds) for a nav dropdown's items to render after opening it
+DROPDOWN_WAIT_TIMEOUT = 5.0
+
+# Maximum wait (seconds) for a detail page's content to render after navigating (the old fixed sleep)
+PAGE_RENDER_TIMEOUT = 2.0
+
+# After clicking a date, showtimes are read once they have changed and then not changed for
+# DATE_SETTLE_TIME seconds, or after DATE_LOAD_TIMEOUT seconds (the old fixed wait)
+DATE_SETTLE_TIME = 0.15
+DATE_LOAD_TIMEOUT = 1.0
+
+
+# JavaScript snippets passed to page.evaluate, built once at import time
+
+# HTTP status of the current document's navigation (Chrome 109+)
+JS_NAVIGATION_STATUS = "performance.getEntriesByType('navigation')[0]?.responseStatus || 0"
+
+# True once the page language is English
+JS_IS_ENGLISH = "(document.documentElement.lang || '').startsWith('en')"
+
+# Click the language switcher until the page is English, all in the page: after each
+# click, waits (via a MutationObserver on the lang attribute) up to waitMs for the switch
+JS_SWITCH_TO_ENGLISH = """
+async (maxClicks, waitMs) => {
+    const root = document.documentElement;
+    const isEnglish = () => (root.lang || '').startsWith('en');
+    const waitForEnglish = () => new Promise(resolve => {
+        if (isEnglish()) return resolve(true);
+        const observer = new MutationObserver(() => {
+            if (isEnglish()) {
+                observer.disconnect();
+                clearTimeout(timer);
+                resolve(true);
+            }
+        });
+        const timer = setTimeout(() => {
+            observer.disconnect();
+            resolve(isEnglish());
+        }, waitMs);
+        observer.observe(root, {attributes: true, attributeFilter: ['lang']});
+    });
+    
+    const initialLang = root.lang;
+    let clicks = 0;
+    let missing = 0;
+    while (!isEnglish() && clicks < maxClicks) {
+        const langWrapper = document.querySelector('div.lang-wrapper.clickable');
+        if (!langWrapper) {
+            // A missing switcher is DOM state, not a race; stop after one retry
+            if (++missing >= 2) break;
+            await new Promise(resolve => setTimeout(resolve, waitMs));
+            continue;
+        }
+        langWrapper.click();
+        clicks++;
+        // Switching language re-renders the page, so drop cached elements
+        window.__cache = {};
+        await waitForEnglish();
+    }
+    return {initialLang: initialLang, lang: root.lang, english: isEnglish(), clicks: clicks, switcherMissing: missing >= 2};
+}
+"""
+
+# Resolve once at least minCount elements match selector (true), or after timeoutMs (false);
+# a MutationObserver reacts to inserted nodes instead of polling
+JS_WAIT_FOR_ELEMENTS = """
+(selector, minCount, timeoutMs) => new Promise(resolve => {
+    const found = () => document.querySelectorAll(selector).length >= minCount;
+    if (found()) return resolve(true);
+    const observer = new MutationObserver(() => {
+        if (found()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(found());
+    }, timeoutMs);
+    observer.observe(document.body, {childList: true, subtree: true});
+})
+"""
+
+# Open the movie dropdown (first nav link)
+JS_OPEN_MOVIE_DROPDOWN = """
+(() => {
+    const cache = window.__cache = window.__cache || {};
+    let linkElements = cache.navLinks;
+    if (!linkElements || !linkElements.length || !linkElements[0].isConnected) {
+        linkElements = cache.navLinks = document.querySelectorAll('div.link.f.center.clickable');
+    }
+    const linkElement = linkElements[0];
+    if (linkElement) {
+        linkElement.click();
+        return true;
+    }
+    return false;
+})()
+"""
+
+# Extract unique movie names and absolute URLs from the open dropdown as a flat [name, url, ...] list
+JS_EXTRACT_MOVIES = """
+(() => {
+    const movies = [];
+    const seen = new Set();
+    const dropdownWrapper = document.querySelector('div.dropdownWrapper');
+    
+    if (dropdownWrapper) {
+        const movieLinks = dropdownWrapper.querySelectorAll('a.dropdownItem.clickable.movie');
+        
+        movieLinks.forEach(link => {
+            const spanElement = link.querySelector('span.dropdownItemText');
+            const movieName = spanElement ? spanElement.textContent.trim() : '';
+            
+            // link.href is already resolved against the page URL
+            if (link.getAttribute('href') && movieName && !seen.has(link.href)) {
+                seen.add(link.href);
+                movies.push(movieName, link.href);
+            }
+        });
+    }
+    
+    return movies;
+})()
+"""
+
+# List the nav dropdowns, close any open one (waiting until none is visible), then click the cinema dropdown
+JS_OPEN_CINEMA_DROPDOWN = """
+(async () => {
+    const cache = window.__cache = window.__cache || {};
+    let linkElements = cache.navLinks;
+    if (!linkElements || !linkElements.length || !linkElements[0].isConnected) {
+        linkElements = cache.navLinks = document.querySelectorAll('div.link.f.center.clickable');
+    }
+    
+    const dropdowns = Array.from(linkElements, (element, index) => ({
+        index: index,
+        text: element.textContent.trim()
+    }));
+    
+    // Click outside any dropdown to close them, and wait (up to a second) until none is visible
+    document.body.click();
+    const anyVisible = () => Array.from(document.querySelectorAll('div.dropdownWrapper')).some(wrapper => {
+        const style = window.getComputedStyle(wrapper);
+        return style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0';
+    });
+    const closeDeadline = Date.now() + 1000;
+    while (anyVisible() && Date.now() < closeDeadline) {
+        await new Promise(resolve => setTimeout(resolve, 50));
+    }
+    
+    if (linkElements.length === 0) {
+        throw new Error('No dropdown elements found');
+    }
+    
+    // Look for the dropdown that contains "Cinema" or similar text
+    for (let element of linkElements) {
+        if (!element) continue;
+        
+        const textContent = element.textContent.toLowerCase().trim();
+        if (textContent.includes('cinema')) {
+            element.click();
+            return {dropdowns: dropdowns, clicked: true};
+        }
+    }
+    
+    // Fallback: try the third element if text search fails
+    if (linkElements.length >= 3 && linkElements[2]) {
+        linkElements[2].click();
+        return {dropdowns: dropdowns, clicked: true};
+    }
+    
+    return {dropdowns: dropdowns, clicked: false};
+})()
+"""
+
+# Extract cinema names and absolute URLs from all groups of the open cinema dropdown
+JS_EXTRACT_CINEMAS = """
+(() => {
+    const dropdownWrappers = Array.from(document.querySelectorAll('div.dropdownWrapper'));
+    
+    // Prefer the visible dropdown wrapper, falling back to the one with the
+    // three region groups (HK, Kowloon, NT)
+    const visibleWrapper = dropdownWrappers.find(wrapper => {
+        const style = window.getComputedStyle(wrapper);
+        return style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0';
+    });
+    // Each wrapper's groups are queried at most once and reused for extraction
+    let groups = visibleWrapper ? visibleWrapper.querySelectorAll('div.dropdownGroup') : null;
+    if (!groups) {
+        for (const wrapper of dropdownWrappers) {
+            const wrapperGroups = wrapper.querySelectorAll('div.dropdownGroup');
+            if (wrapperGroups.length >= 3) {
+                groups = wrapperGroups;
+                break;
+            }
+        }
+    }
+    
+    const cinemas = [];
+    if (!groups) {
+        return cinemas;
+    }
+    
+    groups.forEach((group, groupIndex) => {
+        const allLinks = group.querySelectorAll('a.dropdownItem.clickable');
+        
+        // Skip the first item in each group (index 0) as it's just a region
+        for (let i = 1; i < allLinks.length; i++) {
+            const link = allLinks[i];
+            const href = link.getAttribute('href');
+            // The name span is normally the link's first child; only search the subtree if it is not
+            const firstChild = link.firstElementChild;
+            const spanElement = firstChild && firstChild.matches('span.dropdownItemText')
+                ? firstChild
+                : link.querySelector('span.dropdownItemText');
+            const itemName = spanElement ? spanElement.textContent.trim() : '';
+            
+            if (href && itemName) {
+                // link.href is already resolved against the page URL
+                cinemas.push({
+                    name: itemName,
+                    url: link.href,
+                    group: groupIndex
+                });
+            }
+        }
+    });
+    
+    return cinemas;
+})()
+"""
+
+# Extract the genre/category and synopsis from a rendered movie page in one round trip
+JS_EXTRACT_MOVIE_DETAILS = """
+(() => {
+    let category = 'Unknown';
+    const sectionContainer = document.querySelector('div.flex.flex-row.flex-wrap.sectionContainer.items-center');
+    if (sectionContainer) {
+        // Check if there's an h2 element at the same level that says "Genres"
+        const h2Element = sectionContainer.querySelector('h2');
+        if (h2Element && h2Element.textContent.trim().toLowerCase() === 'genres') {
+            const h3Element = sectionContainer.querySelector('h3');
+            category = h3Element ? h3Element.textContent.trim() : '';
+        }
+    }
+    
+    let description = '';
+    const synopsisContainer = document.querySelector('div.synopsis.desktop-only');
+    if (synopsisContainer) {
+        const firstDiv = synopsisContainer.querySelector('div');
+        description = firstDiv ? firstDiv.textContent.trim() : '';
+    }
+    
+    return {category: category, description: description};
+})()
+"""
+
+# Fetch a movie page's HTML (called with the URL) and extract details from it without rendering;
+# `found` is false when the server-rendered HTML is not in English or has no synopsis container
+JS_FETCH_MOVIE_DETAILS = """
+async (url) => {
+    const response = await fetch(url, {credentials: 'include'});
+    if (!response.ok) {
+        return {status: response.status, found: false};
+    }
+    
+    const doc = new DOMParser().parseFromString(await response.text(), 'text/html');
+    // A page whose locale is only applied client-side would carry the zh-HK text
+    if (!(doc.documentElement.lang || '').startsWith('en')) {
+        return {status: response.status, found: false};
+    }
+    
+    const synopsisContainer = doc.querySelector('div.synopsis.desktop-only');
+    if (!synopsisContainer) {
+        return {status: response.status, found: false};
+    }
+    
+    let category = 'Unknown';
+    const sectionContainer = doc.querySelector('div.flex.flex-row.flex-wrap.sectionContainer.items-center');
+    if (sectionContainer) {
+        const h2Element = sectionContainer.querySelector('h2');
+        if (h2Element && h2Element.textContent.trim().toLowerCase() === 'genres') {
+            const h3Element = sectionContainer.querySelector('h3');
+            category = h3Element ? h3Element.textContent.trim() : '';
+        }
+    }
+    
+    const firstDiv = synopsisContainer.querySelector('div');
+    return {
+        status: response.status,
+        found: true,
+        category: category,
+        description: firstDiv ? firstDiv.textContent.trim() : ''
+    };
+}
+"""
+
+# Extract the address from a cinema page (excluding the favorite button), in one pass over
+# its text nodes instead of cloning it and removing the button and icon
+JS_EXTRACT_CINEMA_ADDRESS = """
+(() => {
+    const addressDiv = document.querySelector('div.sub.f.ai-center');
+    if (!addressDiv) {
+        return '';
+    }
+    
+    // Skip text inside buttons in the address (images have no text nodes)
+    const walker = document.createTreeWalker(addressDiv, NodeFilter.SHOW_TEXT, {
+        acceptNode: node => {
+            const button = node.parentElement.closest('button');
+            return button && addressDiv.contains(button) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT;
+        }
+    });
+    
+    let text = '';
+    while (walker.nextNode()) {
+        text += walker.currentNode.nodeValue;
+    }
+    return text.trim();
+})()
+"""
+
+# Read the text of every date button on a cinema page, in order
+JS_DATE_TEXTS = """
+(() => {
+    return Array.from(document.querySelectorAll('div.dateCell'), dateCell => {
+        const dateDiv = dateCell.querySelector('div.date');
+        return dateDiv ? dateDiv.textContent.trim() : '';
+    });
+})()
+"""
+
+# Extract movies with their language and showtimes for the selected date
+JS_EXTRACT_SHOWTIMES = """
+(() => {
+    const movies = [];
+    const cinemaElements = document.querySelectorAll('div.cinema');
+    
+    cinemaElements.forEach(cinema => {
+        const nameDiv = cinema.querySelector('div.cinemaName div.name');
+        const versionsDiv = cinema.querySelector('div.versions');
+        const timeElements = cinema.querySelectorAll('div.table div.time');
+        
+        const movieName = nameDiv ? nameDiv.textContent.trim() : '';
+        const language = versionsDiv ? versionsDiv.textContent.trim() : '';
+        const showtimes = Array.from(timeElements).map(el => el.textContent.trim());
+        
+        if (movieName && showtimes.length > 0) {
+            movies.push({
+                name: movieName,
+                language: language,
+                showtimes: showtimes
+            });
+        }
+    });
+    
+    return movies;
+})()
+"""
+
+# Click a date button by index (called with the index, quiet period and timeout in ms), wait until
+# the showtimes have changed to a new, non-empty list and then stopped changing, and return
+# {found, movies}. evaluate() turns falsy results into None, so "no such button" is a flag
+# rather than null, and an empty list is a real date without showtimes.
+JS_SELECT_DATE = """
+async (index, quietMs, timeoutMs) => {
+    const dateCell = document.querySelectorAll('div.dateCell')[index];
+    if (!dateCell) {
+        return {found: false, movies: []};
+    }
+    
+    const extract = () => __EXTRACT_SHOWTIMES__;
+    const before = JSON.stringify(extract());
+    
+    // An unchanged or empty list may be a re-render still waiting for the date's data, so only
+    // new, non-empty showtimes start the quiet period; otherwise read them at timeoutMs
+    // (a date without showtimes, or one whose showtimes match the previous date's)
+    await new Promise(resolve => {
+        let quietTimer = null;
+        const finish = () => {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(deadline);
+            resolve();
+        };
+        const observer = new MutationObserver(() => {
+            clearTimeout(quietTimer);
+            const current = JSON.stringify(extract());
+            if (current !== before && current !== '[]') {
+                quietTimer = setTimeout(finish, quietMs);
+            }
+        });
+        const deadline = setTimeout(finish, timeoutMs);
+        observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+        dateCell.click();
+    });
+    
+    return {found: true, movies: extract()};
+}
+""".replace('__EXTRACT_SHOWTIMES__', JS_EXTRACT_SHOWTIMES.strip())
+
+
+class _TokenBucket:
+    """
+    Token bucket rate limiter shared by all tabs.
+    
+    The rate is halved when the site signals rate limiting and recovers gradually
+    on successful requests, never exceeding the configured rate.
+    """
+    
+    def __init__(self, rate: Optional[float], burst: int = 1):
+        """
+        Args:
+            rate: Tokens per second (None disables limiting)
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = None
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait for a token"""
+        if not self.rate:
+            return
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._updated is not None:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._tokens = 0.0
+            self._updated = asyncio.get_running_loop().time()
+    
+    def slow_down(self):
+        """Halve the rate after the site signalled rate limiting"""
+        if self.rate:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+            self._tokens = 0.0
+            logger.warning(f"Rate limited, slowing down to {self.rate:.2f} requests/s")
+    
+    def speed_up(self):
+        """Recover the rate by a tenth of the configured rate after a successful request"""
+        if self.rate and self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class _BrowserPool:
+    """
+    Process-wide pool of started Zendriver browsers and their blank tabs.
+    
+    Browsers are keyed by launch options and by the event loop that owns their
+    CDP connection, so a released browser is only handed out again on the same loop
+    (MovieScraperSync sessions all share one long-lived loop for this reason).
+    Idle browsers are pinged before reuse unless released only seconds ago, stopped
+    once idle for longer than BROWSER_POOL_MAX_IDLE_SECONDS, and capped at
+    BROWSER_POOL_MAX_IDLE per key. With
+    BROWSER_POOL_MIN_IDLE set, spare browsers are started in the background so a
+    restart after a crash or timeout gets a warm browser.
+    """
+    
+    _instance = None
+    
+    def __init__(self):
+        self._idle_browsers: Dict[tuple, List[Tuple[zd.Browser, float]]] = {}
+        self._browser_keys: Dict[int, tuple] = {}
+        self._free_tabs: Dict[int, List[zd.Tab]] = {}
+        self._warming: Dict[tuple, set] = {}
+        # Abandoned launches, browser stops and reaps running in the background, awaited by close_idle
+        self._background: set = set()
+        self.min_idle = BROWSER_POOL_MIN_IDLE
+        self.max_idle = BROWSER_POOL_MAX_IDLE
+        self.max_idle_seconds = BROWSER_POOL_MAX_IDLE_SECONDS
+    
+    @classmethod
+    def instance(cls) -> "_BrowserPool":
+        """Get the shared pool instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    async def acquire(self, headless: bool, browser_args: Tuple[str, ...], no_sandbox: bool) -> zd.Browser:
+        """
+        Get an idle browser started with the same options, or start a new one
+        
+        Args:
+            headless: Whether to run browser in headless mode
+            browser_args: Extra Chrome command line flags
+            no_sandbox: Whether to disable the Chrome sandbox
+        
+        Returns:
+            Started Zendriver browser
+        """
+        key = (headless, tuple(browser_args), no_sandbox, asyncio.get_running_loop())
+        await self._reap_idle(key)
+        
+        browser = None
+        idle = self._idle_browsers.get(key, [])
+        while idle and browser is None:
+            candidate, idle_since = idle.pop()
+            # A browser released a moment ago was just serving pages; only ping ones idle for longer
+            recently_used = time.monotonic() - idle_since < HEALTH_CHECK_IDLE_SECONDS
+            if (recently_used and not candidate.stopped) or await self._is_alive(candidate):
+                logger.info("Reusing pooled Zendriver browser")
+                browser = candidate
+            else:
+                await self.discard(candidate)
+        
+        if browser is None:
+            browser = await self._start(key)
+        
+        self._ensure_min_idle(key)
+        return browser
+    
+    def release(self, browser: zd.Browser):
+        """Return a healthy browser to the pool for later reuse"""
+        key = self._browser_keys.get(id(browser))
+        if key is None or browser.stopped:
+            self._forget(browser)
+            return
+        
+        idle = self._idle_browsers.setdefault(key, [])
+        if len(idle) >= self.max_idle:
+            # Pool is full; stop the browser in the background
+            self._in_background(self.discard(browser))
+            return
+        idle.append((browser, time.monotonic()))
+        
+        # Stop it once idle for too long, even if no session acquires a browser meanwhile
+        asyncio.get_running_loop().call_later(self.max_idle_seconds + 1, lambda: self._in_background(self._reap_idle(key)))
+    
+    async def discard(self, browser: zd.Browser):
+        """Stop a browser and drop it from the pool"""
+        self._forget(browser)
+        await browser.stop()
+    
+    async def _start(self, key: tuple) -> zd.Browser:
+        """
+        Start a browser with the launch options of a pool key
+        
+        Each round launches one browser, plus a second one if the first has not connected
+        within BROWSER_START_HEDGE_DELAY, and keeps the first that connects. Launches are
+        not cancelled midway (a cancelled zd.start leaves its Chrome process behind); the
+        other launch is stopped once it finishes. A new round is only tried when every
+        launch failed or the round timed out, after a short pause from BROWSER_START_BACKOFF.
+        
+        Args:
+            key: Pool key holding the launch options
+        
+        Returns:
+            Started Zendriver browser
+        """
+        headless, browser_args, no_sandbox, _ = key
+        last_error = None
+        
+        def launch() -> asyncio.Future:
+            return asyncio.ensure_future(zd.start(
+                headless=headless,
+                browser_args=list(browser_args),
+                lang="en-US",
+                no_sandbox=no_sandbox
+            ))
+        
+        for round_number in range(1, BROWSER_START_ROUNDS + 1):
+            pending = {launch()}
+            hedged = False
+            browser = None
+            started_at = time.monotonic()
+            deadline = started_at + BROWSER_START_TIMEOUT
+            
+            while pending and browser is None:
+                hedge_at = started_at + BROWSER_START_HEDGE_DELAY
+                wake_at = deadline if hedged else min(deadline, hedge_at)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0, wake_at - time.monotonic()),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                    elif browser is None:
+                        browser = task.result()
+                    else:
+                        self._in_background(task.result().stop())
+                
+                if browser is not None or not pending:
+                    break
+                if not done and time.monotonic() >= deadline:
+                    last_error = TimeoutError(f"browser did not start within {BROWSER_START_TIMEOUT}s")
+                    break
+                if not hedged and time.monotonic() >= hedge_at:
+                    logger.info(f"Browser has not started after {BROWSER_START_HEDGE_DELAY}s, launching another")
+                    pending.add(launch())
+                    hedged = True
+            
+            # Let slower launches finish and stop them, rather than cancelling them midway
+            for task in pending:
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+                task.add_done_callback(self._stop_started)
+            
+            if browser is not None:
+                self._browser_keys[id(browser)] = key
+                self._free_tabs[id(browser)] = [browser.main_tab]
+                return browser
+            
+            logger.warning(f"Browser start round {round_number}/{BROWSER_START_ROUNDS} failed: {last_error}")
+            if round_number < BROWSER_START_ROUNDS:
+                await asyncio.sleep(BROWSER_START_BACKOFF[round_number - 1])
+        
+        raise RuntimeError(f"Could not start browser after {BROWSER_START_ROUNDS} rounds: {last_error}")
+    
+    def _stop_started(self, task: asyncio.Future):
+        """Stop the browser of an abandoned launch once it finishes starting"""
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._in_background(task.result().stop())
+    
+    def _in_background(self, coro):
+        """Run a browser stop or reap as a task that close_idle waits for"""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+    
+    async def _is_alive(self, browser: zd.Browser) -> bool:
+        """Cheaply check that an idle browser still answers over CDP"""
+        if browser.stopped or not browser.connection:
+            return False
+        try:
+            await asyncio.wait_for(browser.connection.send(zd.cdp.browser.get_version()), timeout=TAB_CLEANUP_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled browser failed health check, discarding it: {e}")
+            return False
+    
+    async def _reap_idle(self, key: tuple):
+        """Stop browsers of a key that have been idle for too long"""
+        idle = self._idle_browsers.get(key, [])
+        deadline = time.monotonic() - self.max_idle_seconds
+        for browser, idle_since in [entry for entry in idle if entry[1] < deadline]:
+            idle.remove((browser, idle_since))
+            logger.info("Stopping browser that was idle in the pool for too long")
+            await self.discard(browser)
+    
+    def _ensure_min_idle(self, key: tuple):
+        """Start spare browsers in the background until min_idle are idle or warming (at most max_idle)"""
+        warming = self._warming.setdefault(key, set())
+        missing = min(self.min_idle, self.max_idle) - len(self._idle_browsers.get(key, [])) - len(warming)
+        for _ in range(max(0, missing)):
+            task = asyncio.ensure_future(self._warm(key))
+            warming.add(task)
+            task.add_done_callback(warming.discard)
+    
+    async def _warm(self, key: tuple):
+        """Start one spare browser and park it in the idle pool, unless the pool filled up meanwhile"""
+        try:
+            browser = await self._start(key)
+            idle = self._idle_browsers.setdefault(key, [])
+            if len(idle) >= self.max_idle:
+                await self.discard(browser)
+                return
+            idle.append((browser, time.monotonic()))
+            logger.info("Started spare browser for the pool")
+        except Exception as e:
+            logger.warning(f"Could not start spare browser: {e}")
+    
+    async def acquire_tab(self, browser: zd.Browser) -> zd.Tab:
+        """Get a blank tab of the browser, opening a new one if none is free"""
+        free_tabs = self._free_tabs.setdefault(id(browser), [])
+        if free_tabs:
+            return free_tabs.pop()
+        return await self._open_tab(browser)
+    
+    async def prewarm_tabs(self, browser: zd.Browser, count: int):
+        """Open blank tabs until the browser has at least count free tabs"""
+        free_tabs = self._free_tabs.setdefault(id(browser), [])
+        while len(free_tabs) < count:
+            free_tabs.append(await self._open_tab(browser))
+    
+    async def _open_tab(self, browser: zd.Browser) -> zd.Tab:
+        """Open a new blank tab"""
+        return await browser.get("about:blank", new_tab=True)
+    
+    @staticmethod
+    async def block_resources(tab: zd.Tab, enabled: bool = True):
+        """
+        Stop a tab from downloading resources the scraper never reads (see BLOCKED_URL_PATTERNS)
+        
+        Args:
+            tab: Tab to configure
+            enabled: False to turn blocking (and the Network domain) off again before the tab is reused
+        """
+        try:
+            if enabled:
+                await tab.send(zd.cdp.network.enable())
+                await tab.send(zd.cdp.network.set_blocked_ur_ls(urls=list(BLOCKED_URL_PATTERNS)))
+            else:
+                await tab.send(zd.cdp.network.disable())
+        except Exception as e:
+            logger.warning(f"Could not {'enable' if enabled else 'disable'} resource blocking for tab: {e}")
+    
+    async def release_tab(self, browser: zd.Browser, tab: zd.Tab, max_free: int = MAX_FREE_TABS):
+        """Reset a tab to about:blank and put it back on the browser's free list (closing it if max_free are already free)"""
+        free_tabs = self._free_tabs.setdefault(id(browser), [])
+        if len(free_tabs) >= max_free:
+            await tab.close()
+            return
+        await tab.get("about:blank")
+        free_tabs.append(tab)
+    
+    async def close_idle(self):
+        """Stop all idle browsers owned by the running event loop"""
+        loop = asyncio.get_running_loop()
+        
+        # Let spare browsers that are still starting land in the pool first
+        for key in [key for key in self._warming if key[-1] is loop]:
+            await asyncio.gather(*self._warming.pop(key), return_exceptions=True)
+        
+        for key in [key for key in self._idle_browsers if key[-1] is loop]:
+            for browser, _ in self._idle_browsers.pop(key):
+                await self.discard(browser)
+        
+        # Wait for launches and stops still running in the background, so no browser outlives the loop
+        while True:
+            background = [task for task in self._background if task.get_loop() is loop]
+            if not background:
+                break
+            await asyncio.gather(*background, return_exceptions=True)
+    
+    def _forget(self, browser: zd.Browser):
+        """Drop all bookkeeping for a browser"""
+        self._browser_keys.pop(id(browser), None)
+        self._free_tabs.pop(id(browser), None)
+
 
 class MovieScraper:
     """Movie scraper for hkmovie6.com using Zendriver"""
     
-    def __init__(self, headless: bool = False, delay: float = 2):
+    def __init__(self, headless: bool = False, delay: float = 2, pool_size: int = MAX_CONCURRENT_REQUESTS):
         """
         Initialize the movie scraper.
         
         Args:
             headless: Whether to run browser in headless mode
             delay: Delay between requests in seconds
+            pool_size: Number of tabs used to scrape detail pages concurrently
         """
         self.base_url = "https://hkmovie6.com/"
         self.delay = delay
         self.headless = headless
+        self.pool_size = max(1, pool_size)
+        # Every worker tab plus the homepage tab must fit on the free list, or tabs are reopened on each release
+        self.max_free_tabs = max(MAX_FREE_TABS, self.pool_size + 1)
         self.browser = None
         self.page = None
         self.db_client = SupabaseClient()
-        # Read timeout from environment (default: 60 seconds)
-        self.scraper_timeout = float(os.getenv('SCRAPER_TIMEOUT', '60'))
+        # Per-page timeout from SCRAPER_TIMEOUT (default: 60 seconds)
+        self.scraper_timeout = SCRAPER_TIMEOUT
+        # Serializes browser restarts; the generation lets concurrent tasks skip a restart another task already did
+        self._restart_lock = asyncio.Lock()
+        self._browser_generation = 0
+        # Limits page requests across all tabs to SCRAPER_RATE_LIMIT per second, 0 for no limit (slows down when rate limited)
+        self._rate_limiter = _TokenBucket(SCRAPER_RATE_LIMIT or None, burst=self.pool_size)
+        # Movie details scraped this run, keyed by URL (futures, so concurrent callers share a scrape)
+        self._movie_details_cache: Dict[str, asyncio.Future] = {}
+        # Database IDs by name, loaded on first use ('movies'/'cinemas' -> name -> ID, None if absent)
+        self._ids_by_name: Dict[str, Dict[str, Optional[str]]] = {}
+        self._ids_lock = asyncio.Lock()
+        # Keys of stored showtimes from today on, loaded on first use: (cinema_id, movie_id, showtime, language)
+        self._showtime_index: Optional[Set[Tuple[str, str, datetime, str]]] = None
+        self._showtime_index_lock = asyncio.Lock()
+        # Showtime inserts by cinema ID, kept so a retried scrape waits for one its timed-out attempt started
+        self._showtime_saves: Dict[str, asyncio.Future] = {}
+        # hkmovie6.com cookies captured once the page is in English, replayed into restarted browsers
+        self._locale_cookies: List[zd.cdp.network.CookieParam] = []
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -47,25 +942,16 @@ class MovieScraper:
     async def _setup_browser(self):
         """Set up the Zendriver browser with options"""
         try:
-            # Chrome options for zendriver - using only supported flags
-            browser_args = [
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                # "--disable-blink-features=AutomationControlled",
-                # "--no-sandbox"
-            ]
-            
-            # Read NO_SANDBOX from environment
-            no_sandbox = os.getenv('NO_SANDBOX', 'false').lower() in ('true', '1', 'yes', 'on')
-            
-            # Start browser with zendriver using correct parameter names
-            self.browser = await zd.start(
+            # Reuse a pooled browser started with the same options, or start a new one
+            self.browser = await _BrowserPool.instance().acquire(
                 headless=self.headless,
-                browser_args=browser_args,
-                lang="en-US",
-                no_sandbox=no_sandbox
+                browser_args=BROWSER_ARGS,
+                no_sandbox=NO_SANDBOX
             )
             
+            # Open the worker tabs up front (one extra for the homepage)
+            await _BrowserPool.instance().prewarm_tabs(self.browser, self.pool_size + 1)
+            
             logger.info("Zendriver browser initialized successfully")
             
         except Exception as e:
@@ -73,13 +959,45 @@ class MovieScraper:
             raise
     
     async def close(self):
-        """Close the browser"""
+        """Release the page and return the browser to the pool"""
+        # Let showtime inserts left running by timed-out scrapes finish
+        await asyncio.gather(*self._showtime_saves.values(), return_exceptions=True)
+        self._showtime_saves.clear()
+        
         if self.browser:
             try:
-                await self.browser.stop()
+                if self.page:
+                    # Worker tabs run without the Network domain, and this tab may become one
+                    await _BrowserPool.block_resources(self.page, enabled=False)
+                    await self._release_tab(self.page)
+                _BrowserPool.instance().release(self.browser)
+                logger.info("Browser returned to pool")
+            except Exception as e:
+                logger.error(f"Error releasing browser, stopping it instead: {e}")
+                await self._stop_browser()
+            finally:
+                self.browser = None
+                self.page = None
+    
+    async def _stop_browser(self):
+        """Stop the browser and drop it from the pool"""
+        if self.browser:
+            try:
+                await _BrowserPool.instance().discard(self.browser)
                 logger.info("Browser closed successfully")
             except Exception as e:
                 logger.error(f"Error closing browser: {e}")
+            finally:
+                self.browser = None
+                self.page = None
+    
+    async def _acquire_tab(self) -> zd.Tab:
+        """Get a blank tab from the browser's tab pool"""
+        return await _BrowserPool.instance().acquire_tab(self.browser)
+    
+    async def _release_tab(self, tab: zd.Tab):
+        """Reset a tab and return it to the browser's tab pool"""
+        await _BrowserPool.instance().release_tab(self.browser, tab, self.max_free_tabs)
     
     def _is_connection_error(self, error: Exception) -> bool:
         """
@@ -91,45 +1009,199 @@ class MovieScraper:
         Returns:
             True if this is a connection error that requires restart
         """
-        error_str = str(error).lower()
-        
-        # Common connection error patterns
-        connection_patterns = [
-            'connect call failed',  # Errno 111
-            'connection refused',   # Connection refused
-            'connection reset',     # Connection reset by peer
-            'broken pipe',          # Broken pipe
-            'target closed',        # Browser/page closed
-            'session not created',  # Browser session issues
-            'chrome not reachable', # Chrome unreachable
-            'no such session',      # Session lost
-            'invalid session id',   # Invalid session
-        ]
-        
-        return any(pattern in error_str for pattern in connection_patterns)
-    
-    async def _restart_browser(self):
-        """Restart the browser after timeout or failure"""
-        try:
-            logger.warning("Restarting browser due to timeout or failure...")
+        return bool(CONNECTION_ERROR_PATTERN.search(str(error)))
+    
+    def _backoff_delay(self, attempt: int, base: float = RETRY_BASE_DELAY, cap: float = RETRY_MAX_DELAY) -> float:
+        """
+        Compute an exponential backoff delay with jitter
+        
+        Args:
+            attempt: Zero-based attempt number
+            base: Delay for the first retry in seconds
+            cap: Maximum delay in seconds (before jitter)
             
-            # Close existing browser
-            await self.close()
+        Returns:
+            Delay in seconds
+        """
+        return min(cap, base * 2 ** attempt) + random.uniform(0, base)
+    
+    async def _with_retry(self, coro_factory, attempts: int = RETRY_ATTEMPTS):
+        """
+        Await a page operation, retrying transient failures with exponential backoff
+        
+        Connection errors are raised immediately so callers can restart the browser.
+        
+        Args:
+            coro_factory: Callable returning a new awaitable for each attempt
+            attempts: Maximum number of attempts
             
-            # Setup new browser
-            await self._setup_browser()
+        Returns:
+            Result of the awaited operation
+        """
+        for attempt in range(attempts):
+            try:
+                return await coro_factory()
+            except Exception as e:
+                if self._is_connection_error(e) or attempt == attempts - 1:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"Page operation failed (attempt {attempt + 1}/{attempts}): {e}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
+    async def _evaluate(self, expression: str, page: Optional[zd.Tab] = None, await_promise: bool = False, attempts: int = RETRY_ATTEMPTS):
+        """Evaluate an idempotent expression on a page (the current page by default) with retries"""
+        page = page or self.page
+        return await self._with_retry(lambda: page.evaluate(expression, await_promise=await_promise), attempts)
+    
+    async def _navigate(self, page: zd.Tab, url: str, attempts: int = RETRY_ATTEMPTS):
+        """Navigate a tab to a URL, rate limited across tabs and retried on transient failures"""
+        async def load():
+            await self._rate_limiter.acquire()
+            await page.get(url)
+            
+            # Back off when the site answers with a rate limiting status
+            status = await page.evaluate(JS_NAVIGATION_STATUS)
+            if status in RATE_LIMIT_STATUSES:
+                self._rate_limiter.slow_down()
+                raise Exception(f"Rate limited (HTTP {status}) loading {url}")
+            self._rate_limiter.speed_up()
+        
+        await self._with_retry(load, attempts)
+    
+    async def _run_on_worker_tab(self, scrape, *args):
+        """
+        Run a detail scrape on its own pooled tab, bounded by the scraper timeout
+        
+        Args:
+            scrape: Coroutine function taking *args followed by the tab
+            *args: Arguments passed to scrape before the tab
             
-            # Navigate back to homepage
-            success = await self.navigate_to_homepage()
-            if not success:
-                logger.error("Failed to navigate to homepage after browser restart")
-                raise Exception("Browser restart failed - could not navigate to homepage")
+        Returns:
+            Result of the scrape
+        """
+        # Take the tab under the restart lock so it never comes from a browser being replaced
+        async with self._restart_lock:
+            browser = self.browser
+            tab = await _BrowserPool.instance().acquire_tab(browser)
+        
+        try:
+            return await asyncio.wait_for(scrape(*args, tab), timeout=self.scraper_timeout)
+        finally:
+            # Tabs of a browser that was restarted meanwhile are dropped with it
+            if self.browser is browser:
+                try:
+                    await asyncio.wait_for(
+                        _BrowserPool.instance().release_tab(browser, tab, self.max_free_tabs),
+                        timeout=TAB_CLEANUP_TIMEOUT
+                    )
+                except Exception as e:
+                    # A tab that cannot be reset (e.g. hung on a timed-out page) is closed, not reused
+                    logger.warning(f"Could not return tab to pool, closing it: {e}")
+                    try:
+                        await asyncio.wait_for(tab.close(), timeout=TAB_CLEANUP_TIMEOUT)
+                    except Exception:
+                        pass
+    
+    async def _browser_is_responsive(self) -> bool:
+        """Check whether the current browser still answers over CDP"""
+        return bool(self.browser) and await _BrowserPool.instance()._is_alive(self.browser)
+    
+    async def _recover_browser(self, generation: int):
+        """
+        Recover from a timed out or disconnected page before retrying it
+        
+        A browser that still answers over CDP is kept and the retry just runs on a
+        fresh pooled tab; only an unresponsive browser is restarted.
+        
+        Args:
+            generation: Browser generation the failed scrape ran on
+        """
+        if await self._browser_is_responsive():
+            logger.warning("Browser is still responsive, retrying on a fresh tab")
+            return
+        
+        logger.warning("Browser is unresponsive, restarting browser...")
+        await self._restart_browser(generation)
+    
+    def _when_rendered(self, selector: str, min_count: int, expression: str, timeout: float = DROPDOWN_WAIT_TIMEOUT) -> str:
+        """
+        Build an expression that waits for elements to render and then evaluates another expression
+        
+        Args:
+            selector: CSS selector of the elements to wait for
+            min_count: Number of matching elements to wait for
+            expression: Expression to evaluate once they are present (or the timeout elapses)
+            timeout: Maximum wait in seconds
             
-            logger.info("Browser restarted successfully")
+        Returns:
+            Expression string for page.evaluate (a promise)
+        """
+        wait = self._js_call(JS_WAIT_FOR_ELEMENTS, selector, min_count, int(timeout * 1000))
+        return f"{wait}.then(() => {expression.strip()})"
+    
+    @cached_property
+    def _scrape_cinema_dropdown_expression(self) -> str:
+        """Expression that opens the cinema dropdown and returns its state with the extracted cinemas (built once)"""
+        extract = self._when_rendered('div.dropdownWrapper div.dropdownGroup', 3, JS_EXTRACT_CINEMAS)
+        return f"""(async () => {{
+    const state = await {JS_OPEN_CINEMA_DROPDOWN.strip()};
+    if (state.clicked) {{
+        state.cinemas = await {extract};
+    }}
+    return state;
+}})()"""
+    
+    def _js_call(self, function_source: str, *args) -> str:
+        """
+        Build an expression that calls a JavaScript function source with arguments
+        
+        Zendriver's evaluate does not pass arguments, so they are serialized as
+        JSON literals rather than interpolated into the script text.
+        
+        Args:
+            function_source: JavaScript function source, e.g. "(index) => ..."
+            *args: JSON-serializable arguments
             
-        except Exception as e:
-            logger.error(f"Error restarting browser: {e}")
-            raise
+        Returns:
+            Expression string for page.evaluate
+        """
+        arguments = ', '.join(json.dumps(arg, ensure_ascii=False) for arg in args)
+        return f"({function_source})({arguments})"
+    
+    async def _restart_browser(self, generation: Optional[int] = None):
+        """
+        Restart the browser after timeout or failure
+        
+        Args:
+            generation: Browser generation the caller failed on; if another task has
+                restarted the browser since, no restart is done
+        """
+        async with self._restart_lock:
+            if generation is not None and generation != self._browser_generation and self.browser:
+                logger.info("Browser was already restarted by another task")
+                return
+            
+            try:
+                logger.warning("Restarting browser due to timeout or failure...")
+                self._browser_generation += 1
+                
+                # Stop the existing browser (it is not returned to the pool)
+                await self._stop_browser()
+                
+                # Setup new browser
+                await self._setup_browser()
+                
+                # Navigate back to homepage
+                success = await self.navigate_to_homepage()
+                if not success:
+                    logger.error("Failed to navigate to homepage after browser restart")
+                    raise Exception("Browser restart failed - could not navigate to homepage")
+                
+                logger.info("Browser restarted successfully")
+                
+            except Exception as e:
+                logger.error(f"Error restarting browser: {e}")
+                raise
     
     async def navigate_to_homepage(self) -> bool:
         """
@@ -141,8 +1213,12 @@ class MovieScraper:
         try:
             logger.info(f"Navigating to {self.base_url}")
             
-            # Get a new page/tab
-            self.page = await self.browser.get(self.base_url)
+            # Get a pooled tab and navigate it (with the English locale cookies of an earlier session, if any)
+            if self.page is None:
+                self.page = await self._acquire_tab()
+                await _BrowserPool.block_resources(self.page)
+            await self._restore_locale_cookies()
+            await self._with_retry(lambda: self.page.get(self.base_url))
             
             # Set window size on the page/tab (not browser)
             if not self.headless:
@@ -152,8 +1228,11 @@ class MovieScraper:
                 except Exception as e:
                     logger.warning(f"Could not set window size: {e}")
             
-            # Wait for page to load
-            await asyncio.sleep(2)
+            # Wait for the nav links (and with them the language switcher) to render
+            await self.page.evaluate(
+                self._js_call(JS_WAIT_FOR_ELEMENTS, 'div.link.f.center.clickable', 1, int(PAGE_RENDER_TIMEOUT * 1000)),
+                await_promise=True
+            )
             
             # Check and handle language switching with retry logic
             language_switched = await self._handle_language_switching()
@@ -162,84 +1241,113 @@ class MovieScraper:
                 logger.error("Failed to switch language to English, aborting navigation")
                 return False
             
+            await self._save_locale_cookies()
             return True
             
         except Exception as e:
             logger.error(f"Error navigating to homepage: {e}")
             return False
     
+    async def _save_locale_cookies(self):
+        """Remember the site's cookies once the page is in English, so restarted browsers start in English"""
+        if self._locale_cookies:
+            return
+        try:
+            cookies = await self.browser.cookies.get_all()
+            self._locale_cookies = [
+                zd.cdp.network.CookieParam(
+                    name=cookie.name,
+                    value=cookie.value,
+                    domain=cookie.domain,
+                    path=cookie.path,
+                    secure=cookie.secure,
+                    http_only=cookie.http_only,
+                    same_site=cookie.same_site,
+                    expires=None if cookie.session or cookie.expires is None else zd.cdp.network.TimeSinceEpoch(cookie.expires)
+                )
+                for cookie in cookies
+                if 'hkmovie6' in cookie.domain
+            ]
+        except Exception as e:
+            logger.warning(f"Could not save locale cookies: {e}")
+    
+    async def _restore_locale_cookies(self):
+        """Seed the browser with the saved English locale cookies (no-op before the first switch)"""
+        if not self._locale_cookies:
+            return
+        try:
+            await self.browser.cookies.set_all(self._locale_cookies)
+        except Exception as e:
+            logger.warning(f"Could not restore locale cookies: {e}")
+    
     async def _handle_language_switching(self, max_retries: int = 5):
         """
-        Check the page language and switch to English if needed with retry logic
+        Check the page language and switch to English if needed
+        
+        The whole click-and-wait loop runs in the page as one evaluate call.
         
         Args:
-            max_retries: Maximum number of retry attempts for language switching
+            max_retries: Maximum number of clicks on the language switcher
             
         Returns:
             True if language is English or successfully switched, False otherwise
         """
         try:
-            for attempt in range(max_retries):
-                # Get the current language
-                lang_attr = await self.page.evaluate("document.documentElement.lang")
-                logger.info(f"Language check (attempt {attempt + 1}/{max_retries}): {lang_attr}")
-                
-                # Check if already in English
-                if lang_attr and lang_attr.startswith("en"):
-                    logger.info(f"Page is in English ({lang_attr}), proceeding...")
+            expression = self._js_call(JS_SWITCH_TO_ENGLISH, max_retries, int(LANG_SWITCH_TIMEOUT * 1000))
+            try:
+                result = await asyncio.wait_for(
+                    self.page.evaluate(expression, await_promise=True),
+                    timeout=(max_retries + 1) * LANG_SWITCH_TIMEOUT + 5
+                )
+            except Exception as e:
+                # A switch that reloads the document destroys the context the loop ran in
+                logger.warning(f"Language switch did not complete in page ({e}), checking language again")
+                if await self._wait_for_predicate(JS_IS_ENGLISH, LANG_SWITCH_TIMEOUT):
+                    logger.info("Successfully switched to English")
                     return True
-                
-                # If not English, try to switch
-                if lang_attr == "zh-HK" or not lang_attr or not lang_attr.startswith("en"):
-                    logger.info(f"Page language is '{lang_attr}', attempting to switch to English (attempt {attempt + 1}/{max_retries})")
-                    
-                    try:
-                        # Use evaluate to find and click the language switcher
-                        click_result = await self.page.evaluate("""
-                            (() => {
-                                const langWrapper = document.querySelector('div.lang-wrapper.clickable');
-                                if (langWrapper) {
-                                    langWrapper.click();
-                                    return true;
-                                }
-                                return false;
-                            })()
-                        """)
-                        
-                        if click_result:
-                            logger.info("Found and clicked language switcher")
-                            
-                            # Wait for page to update
-                            await asyncio.sleep(3)
-                            
-                            # Check if language was updated
-                            updated_lang = await self.page.evaluate("document.documentElement.lang")
-                            logger.info(f"Language after clicking: {updated_lang}")
-                            
-                            if updated_lang and updated_lang.startswith("en"):
-                                logger.info("Successfully switched to English")
-                                return True
-                            else:
-                                logger.warning(f"Language switch attempt {attempt + 1} failed, still showing: {updated_lang}")
-                        else:
-                            logger.warning(f"Could not find language switcher element on attempt {attempt + 1}")
-                            
-                    except Exception as click_error:
-                        logger.error(f"Error clicking language switcher on attempt {attempt + 1}: {click_error}")
-                
-                # If not the last attempt, wait before retrying
-                if attempt < max_retries - 1:
-                    logger.info(f"Waiting 2 seconds before retry...")
-                    await asyncio.sleep(2)
+                logger.error("Failed to switch language to English")
+                return False
             
-            # If we get here, all attempts failed
-            final_lang = await self.page.evaluate("document.documentElement.lang")
-            logger.error(f"Failed to switch language to English after {max_retries} attempts. Final language: {final_lang}")
+            if not result:
+                logger.error("Language switch returned no result")
+                return False
+            
+            if result.get('english'):
+                if result.get('clicks'):
+                    logger.info(f"Switched page language from '{result.get('initialLang')}' to '{result.get('lang')}' after {result['clicks']} click(s)")
+                else:
+                    logger.info(f"Page is in English ({result.get('lang')}), proceeding...")
+                return True
+            
+            if result.get('switcherMissing'):
+                logger.error(f"Language switcher absent, giving up. Last language: {result.get('lang')}")
+            else:
+                logger.error(f"Failed to switch language to English after {result.get('clicks')} click(s). Last language: {result.get('lang')}")
             return False
                 
         except Exception as e:
             logger.error(f"Error handling language switching: {e}")
             return False
+    
+    async def _wait_for_predicate(self, expression: str, timeout: float) -> bool:
+        """
+        Poll a JavaScript expression until it is truthy or the timeout expires
+        
+        Args:
+            expression: JavaScript expression to evaluate
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the expression became truthy, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            if await self.page.evaluate(expression):
+                return True
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(PREDICATE_POLL_INTERVAL)
 
     async def scrape_movie_showings(self) -> List[Tuple[str, str]]:
         """
@@ -252,54 +1360,21 @@ class MovieScraper:
             logger.info("Scraping movie showings...")
             
             # First, find and click the dropdown to make it visible
-            dropdown_visible = await self.page.evaluate("""
-                (() => {
-                    const linkElement = document.querySelector('div.link.f.center.clickable');
-                    if (linkElement) {
-                        linkElement.click();
-                        return true;
-                    }
-                    return false;
-                })()
-            """)
+            dropdown_visible = await self.page.evaluate(JS_OPEN_MOVIE_DROPDOWN)
             
             if not dropdown_visible:
                 logger.error("Could not find or click the dropdown menu")
                 return []
             
-            # Wait for dropdown to appear
-            await asyncio.sleep(1)
-            
-            # Extract movie data from the dropdown
-            movies_data = await self.page.evaluate("""
-                (() => {
-                    const movies = [];
-                    const dropdownWrapper = document.querySelector('div.dropdownWrapper');
-                    
-                    if (dropdownWrapper) {
-                        const movieLinks = dropdownWrapper.querySelectorAll('a.dropdownItem.clickable.movie');
-                        
-                        movieLinks.forEach(link => {
-                            const href = link.getAttribute('href');
-                            const spanElement = link.querySelector('span.dropdownItemText');
-                            const movieName = spanElement ? spanElement.textContent.trim() : '';
-                            
-                            if (href && movieName) {
-                                movies.push({
-                                    name: movieName,
-                                    url: href
-                                });
-                            }
-                        });
-                    }
-                    
-                    return movies;
-                })()
-            """)
+            # Wait for the dropdown items to render, then extract them in the same round trip
+            movies_data = await self._evaluate(
+                self._when_rendered('div.dropdownWrapper a.dropdownItem.clickable.movie', 1, JS_EXTRACT_MOVIES),
+                await_promise=True
+            )
             
             if movies_data:
-                logger.info(f"Found {len(movies_data)} movies")
-                return [(movie['name'], "https://hkmovie6.com" + movie['url']) for movie in movies_data]
+                logger.info(f"Found {len(movies_data) // 2} movies")
+                return list(zip(movies_data[0::2], movies_data[1::2]))
             else:
                 logger.warning("No movies found in dropdown")
                 return []
@@ -319,15 +1394,8 @@ class MovieScraper:
         try:
             logger.info(f"Saving {len(movies)} movies to {filename}")
             
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, delimiter='|')
-                
-                # Write header
-                writer.writerow(['name', 'url'])
-                
-                # Write movie data
-                for movie_name, movie_url in movies:
-                    writer.writerow([movie_name, movie_url])
+            # Write in a worker thread so the event loop is not blocked on disk I/O
+            await asyncio.to_thread(self._write_csv_sync, filename, ['name', 'url'], movies)
             
             logger.info(f"Successfully saved movies to {filename}")
             
@@ -348,172 +1416,36 @@ class MovieScraper:
             try:
                 logger.info(f"Scraping cinemas (attempt {attempt + 1}/{max_retries})...")
                 
-                # First, let's debug what dropdowns are available
-                dropdown_info = await self.page.evaluate("""
-                    (() => {
-                        const linkElements = document.querySelectorAll('div.link.f.center.clickable');
-                        const dropdowns = [];
-                        
-                        linkElements.forEach((element, index) => {
-                            dropdowns.push({
-                                index: index,
-                                text: element.textContent.trim()
-                            });
-                        });
-                        
-                        return dropdowns;
-                    })()
-                """)
-                
-                # Close any currently open dropdown first
-                await self.page.evaluate("""
-                    (() => {
-                        // Click outside any dropdown to close them
-                        document.body.click();
-                    })()
-                """)
-                
-                # Wait a moment for dropdown to close
-                await asyncio.sleep(1)
+                # List the available dropdowns, close any open one, click the cinema dropdown,
+                # wait for its three region groups and extract them - all in a single round trip
+                dropdown_state = await self.page.evaluate(self._scrape_cinema_dropdown_expression, await_promise=True)
                 
-                # Find and click the cinema dropdown (look for text content to identify correct one)
-                dropdown_visible = await self.page.evaluate("""
-                    (() => {
-                        const linkElements = document.querySelectorAll('div.link.f.center.clickable');
-                        
-                        if (linkElements.length === 0) {
-                            throw new Error('No dropdown elements found');
-                        }
-                        
-                        // Look for the dropdown that contains "Cinema" or similar text
-                        for (let element of linkElements) {
-                            if (!element) continue;
-                            
-                            const textContent = element.textContent.toLowerCase().trim();
-                            if (textContent.includes('cinema') || textContent.includes('Cinema')) {
-                                element.click();
-                                return true;
-                            }
-                        }
-                        
-                        // Fallback: try the third element if text search fails
-                        if (linkElements.length >= 3 && linkElements[2]) {
-                            linkElements[2].click();
-                            return true;
-                        }
-                        
-                        return false;
-                    })()
-                """)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Available dropdowns: %s", dropdown_state.get('dropdowns') if dropdown_state else [])
+                dropdown_visible = bool(dropdown_state and dropdown_state.get('clicked'))
                 
                 if not dropdown_visible:
                     logger.warning(f"Could not find or click the cinemas dropdown menu (attempt {attempt + 1})")
                     if attempt < max_retries - 1:
-                        logger.info(f"Waiting 3 seconds before retry...")
-                        await asyncio.sleep(3)
+                        delay = self._backoff_delay(attempt)
+                        logger.info(f"Waiting {delay:.1f} seconds before retry...")
+                        await asyncio.sleep(delay)
                         continue
                     else:
                         logger.error("Failed to click cinema dropdown after all retries")
                         return []
                 
-                # Wait for dropdown to appear and load
-                await asyncio.sleep(3)
-                
-                # Extract cinema data from all three dropdown groups
-                cinemas_data = await self.page.evaluate("""
-                    (() => {
-                        const cinemas = [];
-                        
-                        // Get all dropdown wrappers and find the visible/active one
-                        const dropdownWrappers = document.querySelectorAll('div.dropdownWrapper');
-                        let activeDropdownWrapper = null;
-                        
-                        // Find the visible dropdown wrapper
-                        for (let wrapper of dropdownWrappers) {
-                            const style = window.getComputedStyle(wrapper);
-                            if (style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0') {
-                                activeDropdownWrapper = wrapper;
-                                break;
-                            }
-                        }
-                        
-                        if (activeDropdownWrapper) {
-                            const dropdownGroups = activeDropdownWrapper.querySelectorAll('div.dropdownGroup');
-                            
-                            // Debug info
-                            console.log('Found dropdown groups:', dropdownGroups.length);
-                            
-                            dropdownGroups.forEach((group, groupIndex) => {
-                                const allLinks = group.querySelectorAll('a.dropdownItem.clickable');
-                                console.log(`Group ${groupIndex} has ${allLinks.length} links`);
-                                
-                                // Skip the first item in each group (index 0) as it's just a region
-                                for (let i = 1; i < allLinks.length; i++) {
-                                    const link = allLinks[i];
-                                    const href = link.getAttribute('href');
-                                    const spanElement = link.querySelector('span.dropdownItemText');
-                                    const itemName = spanElement ? spanElement.textContent.trim() : '';
-                                    
-                                    console.log(`Group ${groupIndex}, Item ${i}: ${itemName} -> ${href}`);
-                                    
-                                    if (href && itemName) {
-                                        cinemas.push({
-                                            name: itemName,
-                                            url: href,
-                                            group: groupIndex
-                                        });
-                                    }
-                                }
-                            });
-                        } else {
-                            console.log('No active dropdown wrapper found');
-                            
-                            // Fallback: try all dropdown wrappers
-                            for (let wrapper of dropdownWrappers) {
-                                const groups = wrapper.querySelectorAll('div.dropdownGroup');
-                                if (groups.length >= 3) {
-                                    console.log('Using fallback wrapper with', groups.length, 'groups');
-                                    // This is likely the cinema dropdown (has 3 groups: HK, Kowloon, NT)
-                                    activeDropdownWrapper = wrapper;
-                                    break;
-                                }
-                            }
-                            
-                            if (activeDropdownWrapper) {
-                                const dropdownGroups = activeDropdownWrapper.querySelectorAll('div.dropdownGroup');
-                                dropdownGroups.forEach((group, groupIndex) => {
-                                    const allLinks = group.querySelectorAll('a.dropdownItem.clickable');
-                                    
-                                    for (let i = 1; i < allLinks.length; i++) {
-                                        const link = allLinks[i];
-                                        const href = link.getAttribute('href');
-                                        const spanElement = link.querySelector('span.dropdownItemText');
-                                        const itemName = spanElement ? spanElement.textContent.trim() : '';
-                                        
-                                        if (href && itemName) {
-                                            cinemas.push({
-                                                name: itemName,
-                                                url: href,
-                                                group: groupIndex
-                                            });
-                                        }
-                                    }
-                                });
-                            }
-                        }
-                        
-                        return cinemas;
-                    })()
-                """)
+                cinemas_data = dropdown_state.get('cinemas')
                 
                 if cinemas_data:
                     logger.info(f"Found {len(cinemas_data)} cinemas")
-                    return [(cinema['name'], "https://hkmovie6.com" + cinema['url']) for cinema in cinemas_data]
+                    return [(cinema['name'], cinema['url']) for cinema in cinemas_data]
                 else:
                     logger.warning(f"No cinemas found in dropdown (attempt {attempt + 1})")
                     if attempt < max_retries - 1:
-                        logger.info(f"Waiting 3 seconds before retry...")
-                        await asyncio.sleep(3)
+                        delay = self._backoff_delay(attempt)
+                        logger.info(f"Waiting {delay:.1f} seconds before retry...")
+                        await asyncio.sleep(delay)
                         continue
                     else:
                         logger.warning("No cinemas found after all retries")
@@ -524,8 +1456,9 @@ class MovieScraper:
                 logger.error(f"Error scraping cinemas (attempt {attempt + 1}/{max_retries}): {error_msg}")
                 
                 if attempt < max_retries - 1:
-                    logger.info(f"Waiting 3 seconds before retry...")
-                    await asyncio.sleep(3)
+                    delay = self._backoff_delay(attempt)
+                    logger.info(f"Waiting {delay:.1f} seconds before retry...")
+                    await asyncio.sleep(delay)
                 else:
                     logger.error("Failed to scrape cinemas after all retries")
                     return []
@@ -543,21 +1476,78 @@ class MovieScraper:
         try:
             logger.info(f"Saving {len(cinemas)} cinemas to {filename}")
             
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, delimiter='|')
-                
-                # Write header
-                writer.writerow(['name', 'url'])
-                
-                # Write cinema data
-                for cinema_name, cinema_url in cinemas:
-                    writer.writerow([cinema_name, cinema_url])
+            # Write in a worker thread so the event loop is not blocked on disk I/O
+            await asyncio.to_thread(self._write_csv_sync, filename, ['name', 'url'], cinemas)
             
             logger.info(f"Successfully saved cinemas to {filename}")
             
-        except Exception as e:
-            logger.error(f"Error saving cinemas to CSV: {e}")
-
+        except Exception as e:
+            logger.error(f"Error saving cinemas to CSV: {e}")
+
+    def _write_csv_sync(self, filename: str, header: List[str], rows: List[Tuple[str, ...]]):
+        """
+        Write a header and all rows to a pipe-delimited CSV file (blocking)
+        
+        Args:
+            filename: Name of the CSV file to write
+            header: Column names
+            rows: Rows to write in one bulk call
+        """
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile, delimiter='|')
+            writer.writerow(header)
+            writer.writerows(rows)
+    
+    def _format_csv_row(self, row: List[str]) -> str:
+        """
+        Format one pipe-delimited CSV line exactly as csv.writer would, without its per-cell overhead
+        
+        Args:
+            row: Field values
+            
+        Returns:
+            Line including the CRLF terminator
+        """
+        fields = []
+        for value in row:
+            text = str(value)
+            if CSV_QUOTE_PATTERN.search(text):
+                text = '"' + text.replace('"', '""') + '"'
+            fields.append(text)
+        return '|'.join(fields) + '\r\n'
+    
+    def _append_csv_rows_sync(self, csvfile, rows: List[List[str]], flush: bool = True):
+        """Write pre-formatted rows to an open CSV file in one call, optionally flushing them to disk (blocking)"""
+        csvfile.write(''.join(map(self._format_csv_row, rows)))
+        if flush:
+            csvfile.flush()
+    
+    def _read_name_url_pairs(self, infile):
+        """
+        Stream (name, url) pairs from an input CSV, locating the columns from its header
+        
+        Args:
+            infile: Open pipe-delimited CSV file with name and url columns
+            
+        Yields:
+            (name, url) tuples
+        """
+        reader = csv.reader(infile, delimiter='|')
+        header = next(reader, None)
+        if header is None:
+            return
+        
+        name_index, url_index = header.index('name'), header.index('url')
+        min_length = max(name_index, url_index) + 1
+        for row in reader:
+            if len(row) >= min_length:
+                yield row[name_index], row[url_index]
+    
+    def _sync_file_sync(self, csvfile):
+        """Flush an open file and fsync it so its contents survive a crash (blocking)"""
+        csvfile.flush()
+        os.fsync(csvfile.fileno())
+    
     def _sanitize_csv_text(self, text: str) -> str:
         """
         Sanitize text for CSV format with pipe delimiter
@@ -571,17 +1561,16 @@ class MovieScraper:
         if not text:
             return ""
         
-        # Remove or replace problematic characters
-        text = text.replace('\n', ' ').replace('\r', ' ')  # Replace newlines with spaces
-        text = text.replace('|', '｜')  # Replace pipe with similar Unicode character
-        text = text.replace('\t', ' ')  # Replace tabs with spaces
-        text = ' '.join(text.split())  # Normalize whitespace
-        
-        return text.strip()
+        # Replace newlines/tabs with spaces and pipes with a similar Unicode
+        # character in one pass, then normalize whitespace
+        return ' '.join(text.translate(CSV_SANITIZE_TABLE).split())
 
     async def scrape_movie_details(self, movie_name: str, movie_url: str) -> Dict[str, str]:
         """
-        Scrape detailed information for a specific movie with timeout and browser restart
+        Scrape detailed information for a specific movie, memoized by URL for the run
+        
+        Concurrent callers for the same URL share one in-flight scrape. Error results
+        are not kept, so a later call for the URL scrapes it again.
         
         Args:
             movie_name: Name of the movie
@@ -590,109 +1579,159 @@ class MovieScraper:
         Returns:
             Dictionary with movie details
         """
-        try:
-            logger.info(f"Scraping details for movie: {movie_name} (timeout: {self.scraper_timeout}s)")
+        pending = self._movie_details_cache.get(movie_url)
+        if pending is None:
+            pending = asyncio.ensure_future(self._scrape_movie_details_uncached(movie_name, movie_url))
+            self._movie_details_cache[movie_url] = pending
+        else:
+            logger.info(f"Reusing details scraped from {movie_url} for movie: {movie_name}")
+        
+        # Shield the shared scrape so one cancelled caller does not cancel it for the others
+        details = await asyncio.shield(pending)
+        
+        if details.get(FAILED_KEY) and self._movie_details_cache.get(movie_url) is pending:
+            del self._movie_details_cache[movie_url]
+        
+        return {**details, 'name': movie_name}
+    
+    async def _scrape_movie_details_uncached(self, movie_name: str, movie_url: str) -> Dict[str, str]:
+        """
+        Scrape detailed information for a specific movie with timeout and browser restart
+        
+        Args:
+            movie_name: Name of the movie
+            movie_url: URL of the movie page
             
-            # Wrap the scraping logic with timeout
-            return await asyncio.wait_for(
-                self._scrape_movie_details_internal(movie_name, movie_url),
-                timeout=self.scraper_timeout
-            )
+        Returns:
+            Dictionary with movie details
+        """
+        return await self._scrape_with_recovery('movie', movie_name, movie_url, self._scrape_movie_details_internal, MOVIE_FAILURE_DETAILS)
+    
+    async def _scrape_with_recovery(self, label: str, name: str, url: str, scrape, failure_details: Dict[str, Dict[str, str]], attempts: int = DETAIL_RETRY_ATTEMPTS) -> Dict[str, str]:
+        """
+        Run a detail scrape on a worker tab, retrying failures with backoff
+        
+        This is the single retry layer for a detail page. After a timeout or lost
+        connection the browser is recovered before the next attempt.
+        
+        Args:
+            label: Kind of page for logging ("movie" or "cinema")
+            name: Name of the movie or cinema
+            url: URL of the page
+            scrape: Internal scrape coroutine function taking (name, url, tab)
+            failure_details: Fields returned for 'timeout', 'connection' and 'error' failures
+            attempts: Maximum number of attempts
             
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout ({self.scraper_timeout}s) scraping movie details for {movie_name}, restarting browser...")
+        Returns:
+            Dictionary with the scraped details, or name, url and the failure fields with FAILED_KEY set
+        """
+        logger.info(f"Scraping details for {label}: {name} (timeout: {self.scraper_timeout}s)")
+        for attempt in range(attempts):
+            generation = self._browser_generation
             try:
-                await self._restart_browser()
-                # Small delay after restart to let browser stabilize
-                await asyncio.sleep(2)
-                # Retry once after browser restart
-                logger.info(f"Retrying movie details scraping for: {movie_name}")
-                return await asyncio.wait_for(
-                    self._scrape_movie_details_internal(movie_name, movie_url),
-                    timeout=self.scraper_timeout
-                )
-            except Exception as restart_error:
-                logger.error(f"Failed to restart browser or retry scraping for movie {movie_name}: {restart_error}")
-                return {
-                    'name': movie_name,
-                    'url': movie_url,
-                    'category': 'Timeout Error',
-                    'description': 'Timeout error - browser restart failed'
-                }
-        except Exception as e:
-            # Check if this is a connection error that requires browser restart
-            if self._is_connection_error(e):
-                logger.error(f"Connection error scraping movie details for {movie_name}: {e}")
-                logger.warning("Detected connection failure, restarting browser...")
+                # Scrape on a dedicated tab with timeout
+                return await self._run_on_worker_tab(scrape, name, url)
+            except asyncio.TimeoutError:
+                logger.error(f"Timeout ({self.scraper_timeout}s) scraping {label} details for {name}")
+                failure = 'timeout'
+            except Exception as e:
+                if self._is_connection_error(e):
+                    logger.error(f"Connection error scraping {label} details for {name}: {e}")
+                    failure = 'connection'
+                else:
+                    logger.error(f"Error scraping details for {label} {name}: {e}")
+                    failure = 'error'
+            
+            if attempt + 1 == attempts:
+                break
+            
+            # Only a timeout or lost connection is worth recovering the browser for
+            if failure != 'error':
                 try:
-                    await self._restart_browser()
-                    # Small delay after restart to let browser stabilize
-                    await asyncio.sleep(2)
-                    # Retry once after browser restart
-                    logger.info(f"Retrying movie details scraping after connection error for: {movie_name}")
-                    return await asyncio.wait_for(
-                        self._scrape_movie_details_internal(movie_name, movie_url),
-                        timeout=self.scraper_timeout
-                    )
+                    await self._recover_browser(generation)
                 except Exception as restart_error:
-                    logger.error(f"Failed to restart browser or retry scraping for movie {movie_name}: {restart_error}")
-                    return {
-                        'name': movie_name,
-                        'url': movie_url,
-                        'category': 'Connection Error',
-                        'description': 'Connection error - browser restart failed'
-                    }
-            else:
-                logger.error(f"Error scraping details for movie {movie_name}: {e}")
-                return {
-                    'name': movie_name,
-                    'url': movie_url,
-                    'category': 'Error',
-                    'description': 'Error retrieving description'
-                }
+                    logger.error(f"Failed to restart browser for {label} {name}: {restart_error}")
+                    break
+            
+            delay = self._backoff_delay(attempt, base=DETAIL_RETRY_BASE_DELAY, cap=DETAIL_RETRY_MAX_DELAY)
+            logger.info(f"Retrying {label} details scraping for: {name} in {delay:.1f}s (attempt {attempt + 2}/{attempts})")
+            await asyncio.sleep(delay)
+        
+        return {'name': name, 'url': url, **failure_details[failure], FAILED_KEY: True}
+    
+    async def _fetch_movie_details_static(self, movie_url: str) -> Optional[Dict[str, str]]:
+        """
+        Fetch a movie page's HTML from the homepage tab and extract details without rendering it
+        
+        The fetch runs in the already open hkmovie6.com tab, so it is same-origin and carries
+        the language cookie; no page load, subresources or scripts are involved.
+        
+        Args:
+            movie_url: URL of the movie page
+            
+        Returns:
+            Dictionary with category and description, or None if the page needs rendering
+            (including when the served HTML is not in English)
+        """
+        if self.page is None:
+            return None
+        
+        async def fetch():
+            await self._rate_limiter.acquire()
+            result = await self.page.evaluate(self._js_call(JS_FETCH_MOVIE_DETAILS, movie_url), await_promise=True)
+            
+            # Back off when the site answers with a rate limiting status
+            if result and result.get('status') in RATE_LIMIT_STATUSES:
+                self._rate_limiter.slow_down()
+                raise Exception(f"Rate limited (HTTP {result['status']}) fetching {movie_url}")
+            return result
+        
+        try:
+            # A failed fetch falls back to rendering the page rather than being retried
+            result = await self._with_retry(fetch, attempts=1)
+        except Exception as e:
+            if self._is_connection_error(e):
+                raise
+            logger.debug(f"Static fetch failed for {movie_url}, rendering instead: {e}")
+            return None
+        
+        if not result or not result.get('found'):
+            logger.debug(f"Static HTML is not English or lacks movie details for {movie_url}, rendering instead")
+            return None
+        
+        self._rate_limiter.speed_up()
+        return result
     
-    async def _scrape_movie_details_internal(self, movie_name: str, movie_url: str) -> Dict[str, str]:
+    async def _scrape_movie_details_internal(self, movie_name: str, movie_url: str, page: zd.Tab) -> Dict[str, str]:
         """
         Internal method for scraping movie details (called by scrape_movie_details with timeout)
         
         Args:
             movie_name: Name of the movie
             movie_url: URL of the movie page
+            page: Tab to scrape on
             
         Returns:
             Dictionary with movie details
         """
-        # Navigate to movie page
-        await self.page.get(movie_url)
-        await asyncio.sleep(2)
-        
-        # Scrape genre/category
-        category = await self.page.evaluate("""
-            (() => {
-                const sectionContainer = document.querySelector('div.flex.flex-row.flex-wrap.sectionContainer.items-center');
-                if (sectionContainer) {
-                    // Check if there's an h2 element at the same level that says "Genres"
-                    const h2Element = sectionContainer.querySelector('h2');
-                    if (h2Element && h2Element.textContent.trim().toLowerCase() === 'genres') {
-                        const h3Element = sectionContainer.querySelector('h3');
-                        return h3Element ? h3Element.textContent.trim() : '';
-                    }
-                }
-                return 'Unknown';
-            })()
-        """)
-        
-        # Scrape description
-        description = await self.page.evaluate("""
-            (() => {
-                const synopsisContainer = document.querySelector('div.synopsis.desktop-only');
-                if (synopsisContainer) {
-                    const firstDiv = synopsisContainer.querySelector('div');
-                    return firstDiv ? firstDiv.textContent.trim() : '';
-                }
-                return '';
-            })()
-        """)
+        # Try the server-rendered HTML first and only render the page if it lacks the details
+        static_details = await self._fetch_movie_details_static(movie_url)
+        if static_details:
+            category = static_details['category']
+            description = static_details['description']
+        else:
+            # Navigate to movie page
+            await self._navigate(page, movie_url, attempts=1)
+            
+            # Scrape genre/category and description together once the synopsis has rendered
+            details = await self._evaluate(
+                self._when_rendered('div.synopsis.desktop-only', 1, JS_EXTRACT_MOVIE_DETAILS, PAGE_RENDER_TIMEOUT),
+                page,
+                await_promise=True,
+                attempts=1
+            ) or {}
+            category = details.get('category')
+            description = details.get('description')
         
         # Sanitize the description
         sanitized_description = self._sanitize_csv_text(description)
@@ -715,110 +1754,37 @@ class MovieScraper:
         Returns:
             Dictionary with cinema details
         """
-        try:
-            logger.info(f"Scraping details for cinema: {cinema_name} (timeout: {self.scraper_timeout}s)")
-            
-            # Wrap the scraping logic with timeout
-            return await asyncio.wait_for(
-                self._scrape_cinema_details_internal(cinema_name, cinema_url),
-                timeout=self.scraper_timeout
-            )
-            
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout ({self.scraper_timeout}s) scraping cinema details for {cinema_name}, restarting browser...")
-            try:
-                await self._restart_browser()
-                # Small delay after restart to let browser stabilize
-                await asyncio.sleep(2)
-                # Retry once after browser restart
-                logger.info(f"Retrying cinema details scraping for: {cinema_name}")
-                return await asyncio.wait_for(
-                    self._scrape_cinema_details_internal(cinema_name, cinema_url),
-                    timeout=self.scraper_timeout
-                )
-            except Exception as restart_error:
-                logger.error(f"Failed to restart browser or retry scraping for cinema {cinema_name}: {restart_error}")
-                return {
-                    'name': cinema_name,
-                    'url': cinema_url,
-                    'address': 'Timeout error - browser restart failed'
-                }
-        except Exception as e:
-            # Check if this is a connection error that requires browser restart
-            if self._is_connection_error(e):
-                logger.error(f"Connection error scraping cinema details for {cinema_name}: {e}")
-                logger.warning("Detected connection failure, restarting browser...")
-                try:
-                    await self._restart_browser()
-                    # Small delay after restart to let browser stabilize
-                    await asyncio.sleep(2)
-                    # Retry once after browser restart
-                    logger.info(f"Retrying cinema details scraping after connection error for: {cinema_name}")
-                    return await asyncio.wait_for(
-                        self._scrape_cinema_details_internal(cinema_name, cinema_url),
-                        timeout=self.scraper_timeout
-                    )
-                except Exception as restart_error:
-                    logger.error(f"Failed to restart browser or retry scraping for cinema {cinema_name}: {restart_error}")
-                    return {
-                        'name': cinema_name,
-                        'url': cinema_url,
-                        'address': 'Connection error - browser restart failed'
-                    }
-            else:
-                logger.error(f"Error scraping details for cinema {cinema_name}: {e}")
-                return {
-                    'name': cinema_name,
-                    'url': cinema_url,
-                    'address': 'Error retrieving address'
-                }
+        return await self._scrape_with_recovery('cinema', cinema_name, cinema_url, self._scrape_cinema_details_internal, CINEMA_FAILURE_DETAILS)
     
-    async def _scrape_cinema_details_internal(self, cinema_name: str, cinema_url: str) -> Dict[str, str]:
+    async def _scrape_cinema_details_internal(self, cinema_name: str, cinema_url: str, page: zd.Tab) -> Dict[str, str]:
         """
         Internal method for scraping cinema details (called by scrape_cinema_details with timeout)
         
         Args:
             cinema_name: Name of the cinema
             cinema_url: URL of the cinema page
+            page: Tab to scrape on
             
         Returns:
             Dictionary with cinema details
         """
         # Navigate to cinema page
-        await self.page.get(cinema_url)
-        await asyncio.sleep(2)
-        
-        # Scrape address (excluding the favorite button)
-        address = await self.page.evaluate("""
-            (() => {
-                const addressElements = document.querySelectorAll('div.sub.f.ai-center');
-                if (addressElements.length > 0) {
-                    const addressDiv = addressElements[0];
-                    
-                    // Clone the element to avoid modifying the original
-                    const clonedDiv = addressDiv.cloneNode(true);
-                    
-                    // Remove any button elements (like the favorite button)
-                    const buttons = clonedDiv.querySelectorAll('button');
-                    buttons.forEach(button => button.remove());
-                    
-                    // Remove any img elements (location icon)
-                    const images = clonedDiv.querySelectorAll('img');
-                    images.forEach(img => img.remove());
-                    
-                    // Get the clean text content
-                    return clonedDiv.textContent.trim();
-                }
-                return '';
-            })()
-        """)
+        await self._navigate(page, cinema_url, attempts=1)
+        
+        # Scrape address (excluding the favorite button) once the date buttons have rendered
+        address = await self._evaluate(
+            self._when_rendered('div.dateCell', 1, JS_EXTRACT_CINEMA_ADDRESS, PAGE_RENDER_TIMEOUT),
+            page,
+            await_promise=True,
+            attempts=1
+        )
         
         # Sanitize the address
         sanitized_address = self._sanitize_csv_text(address)
         
         # Get cinema_id from database (cinema should already exist)
-        cinema_data = self.db_client.get_cinema_by_name(cinema_name)
-        if not cinema_data:
+        cinema_id = await self._lookup_id('cinemas', cinema_name)
+        if not cinema_id:
             logger.error(f"Cinema '{cinema_name}' not found in database")
             return {
                 'name': cinema_name,
@@ -826,11 +1792,10 @@ class MovieScraper:
                 'address': sanitized_address or 'Address not available'
             }
         
-        cinema_id = cinema_data['id']
         logger.info(f"Found cinema in database with ID: {cinema_id}")
         
         # Now scrape showtimes on the same page
-        await self._scrape_showtimes_for_cinema(cinema_id, cinema_name)
+        await self._scrape_showtimes_for_cinema(cinema_id, cinema_name, page)
         
         return {
             'name': cinema_name,
@@ -838,92 +1803,55 @@ class MovieScraper:
             'address': sanitized_address or 'Address not available'
         }
     
-    async def _scrape_showtimes_for_cinema(self, cinema_id: str, cinema_name: str):
+    async def _scrape_showtimes_for_cinema(self, cinema_id: str, cinema_name: str, page: zd.Tab):
         """
-        Scrape showtimes for a specific cinema (assumes we're already on the cinema page)
+        Scrape showtimes for a specific cinema (assumes the tab is already on the cinema page)
         
         Args:
             cinema_id: Database ID of the cinema
             cinema_name: Name of the cinema for logging
+            page: Tab showing the cinema page
         """
         try:
             logger.info(f"Scraping showtimes for cinema: {cinema_name}")
             
-            # Get all date buttons
-            date_buttons = await self.page.evaluate("""
-                (() => {
-                    const dateCells = document.querySelectorAll('div.dateCell');
-                    return dateCells.length;
-                })()
-            """)
+            # Get the text of all date buttons
+            date_texts = await page.evaluate(JS_DATE_TEXTS)
             
-            if not date_buttons:
+            if not date_texts:
                 logger.warning(f"No date buttons found for cinema: {cinema_name}")
                 return
             
-            logger.info(f"Found {date_buttons} date buttons for cinema: {cinema_name}")
+            logger.info(f"Found {len(date_texts)} date buttons for cinema: {cinema_name}")
+            
+            # Showtimes of all dates, checked against the database and inserted together at the end
+            showtime_rows = []
+            today = date.today()
             
             # Process each date
-            for date_index in range(date_buttons):
+            for date_index, date_text in enumerate(date_texts):
                 try:
-                    # Click on the date button
-                    date_text = await self.page.evaluate(f"""
-                        (() => {{
-                            const dateCells = document.querySelectorAll('div.dateCell');
-                            if (dateCells.length > {date_index}) {{
-                                const dateCell = dateCells[{date_index}];
-                                dateCell.click();
-                                
-                                // Get the date text
-                                const dateDiv = dateCell.querySelector('div.date');
-                                return dateDiv ? dateDiv.textContent.trim() : '';
-                            }}
-                            return '';
-                        }})()
-                    """)
-                    
                     if not date_text:
                         logger.warning(f"Could not get date text for button {date_index}")
                         continue
                     
                     # Parse the date and convert to full date
-                    show_date = self._parse_date_text(date_text)
+                    show_date = self._parse_date_text(date_text, today)
                     if not show_date:
                         logger.warning(f"Could not parse date: {date_text}")
                         continue
                     
                     logger.info(f"Processing date {date_text} -> {show_date}")
                     
-                    # Wait for content to load after clicking date
-                    await asyncio.sleep(1)
-                    
-                    # Get all movies for this date
-                    movies_data = await self.page.evaluate("""
-                        (() => {
-                            const movies = [];
-                            const cinemaElements = document.querySelectorAll('div.cinema');
-                            
-                            cinemaElements.forEach(cinema => {
-                                const nameDiv = cinema.querySelector('div.cinemaName div.name');
-                                const versionsDiv = cinema.querySelector('div.versions');
-                                const timeElements = cinema.querySelectorAll('div.table div.time');
-                                
-                                const movieName = nameDiv ? nameDiv.textContent.trim() : '';
-                                const language = versionsDiv ? versionsDiv.textContent.trim() : '';
-                                const showtimes = Array.from(timeElements).map(el => el.textContent.trim());
-                                
-                                if (movieName && showtimes.length > 0) {
-                                    movies.push({
-                                        name: movieName,
-                                        language: language,
-                                        showtimes: showtimes
-                                    });
-                                }
-                            });
-                            
-                            return movies;
-                        })()
-                    """)
+                    # Click on the date button, wait for its showtimes to render and extract them
+                    result = await page.evaluate(
+                        self._js_call(JS_SELECT_DATE, date_index, int(DATE_SETTLE_TIME * 1000), int(DATE_LOAD_TIMEOUT * 1000)),
+                        await_promise=True
+                    )
+                    if not result or not result.get('found'):
+                        logger.warning(f"Date button {date_index} is gone from the page")
+                        continue
+                    movies_data = result.get('movies') or []
                     
                     logger.info(f"Found {len(movies_data)} movies for date {date_text}")
                     
@@ -934,21 +1862,53 @@ class MovieScraper:
                             movie_info['name'], 
                             movie_info['language'], 
                             movie_info['showtimes'], 
-                            show_date
+                            show_date,
+                            showtime_rows
                         )
                     
                 except Exception as e:
                     logger.error(f"Error processing date {date_index} for cinema {cinema_name}: {e}")
                     continue
             
+            await self._save_showtimes(cinema_id, cinema_name, showtime_rows)
+            
             logger.info(f"Completed showtime scraping for cinema: {cinema_name}")
             
         except Exception as e:
             logger.error(f"Error scraping showtimes for cinema {cinema_name}: {e}")
     
-    async def _process_movie_showtimes(self, cinema_id: str, movie_name: str, language: str, showtimes: List[str], show_date: date):
+    async def _lookup_id(self, table_name: str, name: str) -> Optional[str]:
+        """
+        Get the database ID of a movie or cinema by exact name from an in-memory map
+        
+        The whole table's IDs are fetched once on first use; names missing from it are
+        looked up individually once and the result (including "not found") is remembered.
+        
+        Args:
+            table_name: 'movies' or 'cinemas'
+            name: Movie or cinema name
+            
+        Returns:
+            ID, or None if there is no row with that name
+        """
+        ids = self._ids_by_name.get(table_name)
+        if ids is None:
+            async with self._ids_lock:
+                ids = self._ids_by_name.get(table_name)
+                if ids is None:
+                    fetch_all = self.db_client.get_movie_ids if table_name == 'movies' else self.db_client.get_cinema_ids
+                    ids = self._ids_by_name[table_name] = await asyncio.to_thread(fetch_all)
+                    logger.info(f"Loaded {len(ids)} {table_name} IDs from database")
+        
+        if name not in ids:
+            get_by_name = self.db_client.get_movie_by_name if table_name == 'movies' else self.db_client.get_cinema_by_name
+            row = await asyncio.to_thread(get_by_name, name)
+            ids[name] = row['id'] if row else None
+        return ids[name]
+    
+    async def _process_movie_showtimes(self, cinema_id: str, movie_name: str, language: str, showtimes: List[str], show_date: date, rows: List[Dict[str, str]]):
         """
-        Process showtimes for a specific movie and add to database if not exists
+        Convert showtimes for a specific movie into database rows (saved later by _save_showtimes)
         
         Args:
             cinema_id: Database ID of the cinema
@@ -956,96 +1916,140 @@ class MovieScraper:
             language: Language/version of the movie
             showtimes: List of showtime strings in HH:MM format
             show_date: Date object for the show date
+            rows: List the showtime rows are appended to
         """
         try:
             # Get movie_id from database
-            movie_data = self.db_client.get_movie_by_name(movie_name)
-            if not movie_data:
+            movie_id = await self._lookup_id('movies', movie_name)
+            if not movie_id:
                 logger.warning(f"Movie '{movie_name}' not found in database, skipping showtimes")
                 return
             
-            movie_id = movie_data['id']
-            
-            showtimes_added = 0
-            showtimes_skipped = 0
-            
             # Process each showtime
             for showtime_str in showtimes:
-                try:
-                    # Convert showtime string to full timestamp
-                    showtime_timestamp = self._convert_to_timestamp(showtime_str, show_date)
-                    if not showtime_timestamp:
-                        logger.warning(f"Could not convert showtime: {showtime_str}")
-                        continue
-                    
-                    # Check if showtime already exists
-                    if self.db_client.showtime_exists(movie_id, cinema_id, showtime_timestamp, language):
-                        showtimes_skipped += 1
-                        continue
-                    
-                    # Add new showtime
-                    showtime_data = {
-                        'movie_id': movie_id,
-                        'cinema_id': cinema_id,
-                        'showtime': showtime_timestamp,
-                        'language': language
-                    }
-                    
-                    showtime_id = self.db_client.add_showtime(showtime_data)
-                    if showtime_id:
-                        showtimes_added += 1
-                    else:
-                        logger.error(f"Failed to add showtime: {showtime_data}")
-                
-                except Exception as e:
-                    logger.error(f"Error processing showtime {showtime_str}: {e}")
+                # Convert showtime string to full timestamp
+                showtime_timestamp = self._convert_to_timestamp(showtime_str, show_date)
+                if not showtime_timestamp:
+                    logger.warning(f"Could not convert showtime: {showtime_str}")
                     continue
-            
-            if showtimes_added > 0 or showtimes_skipped > 0:
-                logger.info(f"Movie '{movie_name}' ({language}): {showtimes_added} added, {showtimes_skipped} skipped")
+                
+                rows.append({
+                    'movie_id': movie_id,
+                    'cinema_id': cinema_id,
+                    'showtime': showtime_timestamp,
+                    'language': language
+                })
             
         except Exception as e:
             logger.error(f"Error processing movie showtimes for {movie_name}: {e}")
     
-    def _parse_date_text(self, date_text: str) -> Optional[date]:
+    async def _load_showtime_index(self) -> Optional[Set[Tuple[str, str, datetime, str]]]:
+        """
+        Get the index of stored showtimes from today on, loading it with one paged query on first use
+        
+        Returns:
+            Set of (cinema_id, movie_id, showtime, language) keys, or None if it could not be loaded
+        """
+        if self._showtime_index is None:
+            async with self._showtime_index_lock:
+                if self._showtime_index is None:
+                    self._showtime_index = await asyncio.to_thread(self.db_client.get_upcoming_showtimes, date.today().isoformat())
+                    if self._showtime_index is not None:
+                        logger.info(f"Loaded {len(self._showtime_index)} upcoming showtimes from database")
+        return self._showtime_index
+    
+    async def _save_showtimes(self, cinema_id: str, cinema_name: str, rows: List[Dict[str, str]]):
+        """
+        Add a cinema's scraped showtimes that are not in the database yet with one insert
+        
+        The save is shielded from the scrape timeout, so an insert that has started always
+        records its rows in the showtime index. A retry of the cinema first waits for a save
+        left running by the timed-out attempt, so it never inserts the same showtimes again.
+        
+        Args:
+            cinema_id: Database ID of the cinema
+            cinema_name: Name of the cinema for logging
+            rows: Showtime rows built by _process_movie_showtimes
+        """
+        if not rows:
+            return
+        
+        previous = self._showtime_saves.get(cinema_id)
+        if previous is not None and not previous.done():
+            await asyncio.wait({previous})
+        
+        save = asyncio.ensure_future(self._insert_new_showtimes(cinema_id, cinema_name, rows))
+        self._showtime_saves[cinema_id] = save
+        await asyncio.shield(save)
+    
+    async def _insert_new_showtimes(self, cinema_id: str, cinema_name: str, rows: List[Dict[str, str]]):
+        """
+        Insert the showtimes of a cinema that are not in the database yet (see _save_showtimes)
+        
+        Showtimes are checked against the in-memory showtime index; if it could not be
+        loaded, the cinema's showtimes are looked up with one query instead.
+        
+        Args:
+            cinema_id: Database ID of the cinema
+            cinema_name: Name of the cinema for logging
+            rows: Showtime rows built by _process_movie_showtimes
+        """
+        try:
+            index = await self._load_showtime_index()
+            if index is None:
+                index = {(cinema_id, *key) for key in await asyncio.to_thread(self.db_client.existing_showtimes, cinema_id, [row['showtime'] for row in rows])}
+            
+            # Keys of the new showtimes (also dedupes the batch itself)
+            new_keys = {}
+            for row in rows:
+                key = (cinema_id, row['movie_id'], datetime.fromisoformat(row['showtime']), row['language'])
+                if key not in index and key not in new_keys:
+                    new_keys[key] = row
+            
+            added = await asyncio.to_thread(self.db_client.add_showtimes_bulk, list(new_keys.values())) if new_keys else set()
+            logger.info(f"Cinema '{cinema_name}': {len(added)} showtimes added, {len(rows) - len(new_keys)} skipped")
+            
+            # Record exactly the rows the database stored, so a partial insert is not retried for them
+            if index is self._showtime_index:
+                index.update(added)
+            
+        except Exception as e:
+            logger.error(f"Error saving showtimes for cinema {cinema_name}: {e}")
+    
+    def _parse_date_text(self, date_text: str, today: Optional[date] = None) -> Optional[date]:
         """
         Parse date text in day/month format and convert to full date
         
         Args:
             date_text: Date string in format like "15/12" or "15/1"
+            today: Today's date (looked up if not given; callers parsing many dates pass it once)
             
         Returns:
             Date object or None if parsing fails
         """
+        match = DATE_TEXT_PATTERN.fullmatch(date_text)
+        if not match:
+            return None
+        
+        day = int(match[1])
+        month = int(match[2])
+        
+        # Use the current year
+        today = today or date.today()
+        current_year = today.year
+        
+        # Create date with current year
         try:
-            # Remove any extra whitespace and split
-            parts = date_text.strip().split('/')
-            if len(parts) != 2:
-                return None
+            show_date = date(current_year, month, day)
             
-            day = int(parts[0])
-            month = int(parts[1])
+            # If the date is in the past (more than 1 day ago), use next year
+            if show_date < today:
+                show_date = date(current_year + 1, month, day)
             
-            # Get current year
-            current_year = datetime.now().year
-            
-            # Create date with current year
-            try:
-                show_date = date(current_year, month, day)
-                
-                # If the date is in the past (more than 1 day ago), use next year
-                today = date.today()
-                if show_date < today:
-                    show_date = date(current_year + 1, month, day)
-                
-                return show_date
-                
-            except ValueError:
-                logger.error(f"Invalid date: day={day}, month={month}, year={current_year}")
-                return None
+            return show_date
             
-        except (ValueError, IndexError) as e:
-            logger.error(f"Error parsing date text '{date_text}': {e}")
+        except ValueError:
+            logger.error(f"Invalid date: day={day}, month={month}, year={current_year}")
             return None
     
     def _convert_to_timestamp(self, time_str: str, show_date: date) -> Optional[str]:
@@ -1061,105 +2065,283 @@ class MovieScraper:
         """
         try:
             # Parse time string
-            time_parts = time_str.strip().split(':')
-            if len(time_parts) != 2:
+            hour_text, separator, minute_text = time_str.partition(':')
+            if not separator or ':' in minute_text:
                 return None
             
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
+            # int() ignores surrounding whitespace
+            hour = int(hour_text)
+            minute = int(minute_text)
             
             # Create datetime object
-            show_datetime = datetime.combine(show_date, datetime.min.time().replace(hour=hour, minute=minute))
+            show_datetime = datetime(show_date.year, show_date.month, show_date.day, hour, minute)
             
             # Convert to ISO format string (assumes local timezone)
             return show_datetime.isoformat()
             
-        except (ValueError, IndexError) as e:
+        except ValueError as e:
             logger.error(f"Error converting time '{time_str}' for date {show_date}: {e}")
             return None
 
-    async def scrape_all_movie_details(self, movies_csv_file: str = "movies.csv", output_file: str = "movies_details.csv"):
+    async def _write_rows_from_queue(self, rows: asyncio.Queue, csvfile):
+        """
+        Append rows from a queue to an open CSV file until a None sentinel arrives
+        
+        A single writer owns the file, so concurrent scrape tasks never interleave writes.
+        Rows already queued are written together (up to CSV_WRITE_BATCH_SIZE per call)
+        and flushed every CSV_FLUSH_EVERY rows; the rest is synced when the run ends.
+        
+        Args:
+            rows: Queue of rows (lists of values), terminated by None
+            csvfile: Open output file
+        """
+        unflushed = 0
+        done = False
+        while not done:
+            batch = []
+            row = await rows.get()
+            
+            # Take whatever else is already queued without waiting
+            while row is not None:
+                batch.append(row)
+                if len(batch) >= CSV_WRITE_BATCH_SIZE or rows.empty():
+                    break
+                row = rows.get_nowait()
+            done = row is None
+            
+            if batch:
+                unflushed += len(batch)
+                flush = unflushed >= CSV_FLUSH_EVERY
+                if flush:
+                    unflushed = 0
+                await asyncio.to_thread(self._append_csv_rows_sync, csvfile, batch, flush)
+    
+    async def _insert_records_from_queue(self, records: asyncio.Queue, add_bulk) -> int:
+        """
+        Insert records from a queue into the database in batches until a None sentinel arrives
+        
+        Inserts run in a worker thread, so scraping continues while a batch is written.
+        
+        Args:
+            records: Queue of record dictionaries, terminated by None
+            add_bulk: Bulk insert method of the database client
+            
+        Returns:
+            Number of records added
+        """
+        added = 0
+        batch = []
+        while True:
+            record = await records.get()
+            if record is not None:
+                batch.append(record)
+            if record is None or len(batch) >= DB_INSERT_BATCH_SIZE:
+                if batch:
+                    added += len(await asyncio.to_thread(add_bulk, batch))
+                    batch = []
+                if record is None:
+                    return added
+    
+    async def _put_to_stage(self, queue: asyncio.Queue, item, stage: asyncio.Task):
+        """
+        Put an item on a stage's queue, failing instead of blocking forever if the stage has stopped
+        
+        Args:
+            queue: Bounded queue consumed by the stage
+            item: Item to put
+            stage: Task consuming the queue
+        """
+        if not stage.done() and not queue.full():
+            queue.put_nowait(item)
+            return
+        
+        if not stage.done():
+            put = asyncio.ensure_future(queue.put(item))
+            await asyncio.wait({put, stage}, return_when=asyncio.FIRST_COMPLETED)
+            if put.done():
+                return
+            put.cancel()
+        
+        # Re-raise the stage's error (a stage only returns after its None sentinel)
+        stage.result()
+        raise RuntimeError("Pipeline stage stopped before the end of its input")
+    
+    async def _run_workers(self, produce, process):
+        """
+        Feed work items from an async producer to pool_size concurrent workers
+        
+        The queue between them is bounded, so the producer reads its input only as
+        fast as the workers consume it.
+        
+        Args:
+            produce: Async iterable of argument tuples
+            process: Coroutine function called with each argument tuple
+        """
+        work = asyncio.Queue(maxsize=self.pool_size * 2)
+        
+        async def feed():
+            try:
+                async for item in produce:
+                    await work.put(item)
+            finally:
+                for _ in range(self.pool_size):
+                    await work.put(None)
+        
+        async def consume():
+            while True:
+                item = await work.get()
+                if item is None:
+                    break
+                await process(*item)
+        
+        tasks = [asyncio.ensure_future(feed())]
+        tasks.extend(asyncio.ensure_future(consume()) for _ in range(self.pool_size))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _scrape_all(self, input_file: str, output_file: str, *, produce, scrape_one, add_bulk, columns: Tuple[str, ...], label: str) -> Tuple[int, int]:
+        """
+        Run the detail pipeline shared by movies and cinemas
+        
+        Items are streamed from the input CSV and scraped by pool_size workers on separate
+        tabs. Each result goes to a database stage (bulk inserts) and a CSV stage (one open
+        output file) that run alongside the scrapers.
+        
+        Args:
+            input_file: Input CSV file
+            output_file: Output CSV file for the scraped details
+            produce: Async generator function taking the input's (name, url) pairs and yielding those to scrape
+            scrape_one: Coroutine function taking (name, url) and returning (details, add_to_db)
+            add_bulk: Bulk insert method of the database client
+            columns: Output columns, which are also the details keys
+            label: Item name for log messages
+            
+        Returns:
+            Tuple of (items processed, items added to database)
+        """
+        processed = 0
+        records = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+        rows = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+        
+        async def process(name: str, url: str):
+            nonlocal processed
+            logger.info(f"Processing {label}: {name}")
+            
+            details, add_to_db = await scrape_one(name, url)
+            if add_to_db:
+                # The details dict has exactly the table's columns, so it is the database record
+                await self._put_to_stage(records, details, db_task)
+            
+            # Hand the row to the writer as soon as the item is scraped
+            await self._put_to_stage(rows, [details[column] for column in columns], writer_task)
+            
+            # Numbered on completion, as workers finish items out of order
+            processed += 1
+            logger.info(f"Finished {label} {processed}: {name}")
+        
+        # Stream items from the input CSV and keep one output handle open for the run
+        with open(input_file, 'r', encoding='utf-8') as infile, \
+                open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_SIZE) as outfile:
+            outfile.write(self._format_csv_row(columns))
+            outfile.flush()  # Ensure header is written immediately
+            
+            db_task = asyncio.create_task(self._insert_records_from_queue(records, add_bulk))
+            writer_task = asyncio.create_task(self._write_rows_from_queue(rows, outfile))
+            
+            # A stage that fails makes the workers' next put raise, which cancels the other workers
+            try:
+                await self._run_workers(produce(self._read_name_url_pairs(infile)), process)
+            finally:
+                for queue, stage in ((records, db_task), (rows, writer_task)):
+                    try:
+                        await self._put_to_stage(queue, None, stage)
+                    except Exception:
+                        pass  # The stage's error is raised below
+                added, written = await asyncio.gather(db_task, writer_task, return_exceptions=True)
+                # Also runs when the run is interrupted (Ctrl+C cancels the task)
+                await asyncio.to_thread(self._sync_file_sync, outfile)
+                for result in (added, written):
+                    if isinstance(result, BaseException):
+                        raise result
+        
+        return processed, added
+    
+    async def scrape_all_movie_details(self, movies_csv_file: str = "movies.csv", output_file: str = "movies_details.csv", failed_file: str = "movies_failed.csv"):
         """
         Scrape details for all movies from CSV file
         Check if movie exists in database before scraping
         
+        Movies are streamed from the input and scraped concurrently on separate tabs
+        (pool_size workers). Failed scrapes are retried with backoff; movies that still
+        fail are not added to the database (so the next run retries them) and are
+        listed in failed_file.
+        
         Args:
             movies_csv_file: Input CSV file with movies
             output_file: Output CSV file for detailed movie information
+            failed_file: Output CSV file listing movies that could not be scraped
         """
         try:
             logger.info(f"Scraping details for all movies from {movies_csv_file}")
             
-            # Read movies from CSV
-            movies = []
-            with open(movies_csv_file, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile, delimiter='|')
-                for row in reader:
-                    movies.append((row['name'], row['url']))
-            
-            logger.info(f"Found {len(movies)} movies to process")
-            
-            # Create output CSV with header
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, delimiter='|')
-                writer.writerow(['name', 'url', 'category', 'description'])
-                csvfile.flush()  # Ensure header is written immediately
-            
-            # Process each movie and append immediately
-            movies_processed = 0
             movies_skipped = 0
-            movies_added = 0
+            failed_movies = []
             
-            for i, (movie_name, movie_url) in enumerate(movies, 1):
-                logger.info(f"Processing movie {i}/{len(movies)}: {movie_name}")
+            async def pending_movies(pairs):
+                nonlocal movies_skipped
+                movies = iter(pairs)
+                scheduled_names = set()
                 
-                # Check if movie already exists in database
-                if self.db_client.movie_exists(movie_name):
-                    logger.info(f"Movie '{movie_name}' already exists in database, skipping...")
-                    movies_skipped += 1
-                    continue
-                
-                # Movie doesn't exist, scrape details
-                logger.info(f"Movie '{movie_name}' not found in database, scraping details...")
+                while True:
+                    # Read the next batch of movies without loading the whole file
+                    batch = list(itertools.islice(movies, INPUT_BATCH_SIZE))
+                    if not batch:
+                        break
+                    
+                    # Check which movies in this batch already exist in database with one lookup
+                    existing_names = await asyncio.to_thread(self.db_client.existing_movie_names, [name for name, _ in batch])
+                    
+                    for movie_name, movie_url in batch:
+                        if movie_name in existing_names or movie_name in scheduled_names:
+                            movies_skipped += 1
+                            continue
+                        scheduled_names.add(movie_name)
+                        yield movie_name, movie_url
+            
+            async def scrape_movie(movie_name: str, movie_url: str):
+                # Movie doesn't exist, scrape details (failures are retried by _scrape_with_recovery)
                 movie_details = await self.scrape_movie_details(movie_name, movie_url)
                 
-                # Prepare movie data for database
-                movie_data = {
-                    'name': movie_details['name'],
-                    'url': movie_details['url'],
-                    'category': movie_details['category'],
-                    'description': movie_details['description']
-                }
-                
-                # Add movie to database
-                movie_id = self.db_client.add_movie(movie_data)
-                if movie_id:
-                    # logger.info(f"Successfully added movie '{movie_name}' to database (ID: {movie_id})")
-                    movies_added += 1
-                else:
-                    logger.error(f"Failed to add movie '{movie_name}' to database")
-                
-                # Append to CSV immediately after scraping each movie
-                with open(output_file, 'a', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile, delimiter='|')
-                    writer.writerow([
-                        movie_details['name'],
-                        movie_details['url'],
-                        movie_details['category'],
-                        movie_details['description']
-                    ])
-                    csvfile.flush()  # Ensure data is written to disk immediately
-                
-                # logger.info(f"Saved details for movie: {movie_name}")
-                movies_processed += 1
-                
-                # Small delay between requests to be respectful
-                await asyncio.sleep(1)
+                if movie_details.get(FAILED_KEY):
+                    # Keep failed movies out of the database so the next run picks them up again
+                    logger.error(f"Giving up on movie '{movie_name}' after {DETAIL_RETRY_ATTEMPTS} attempts")
+                    failed_movies.append((movie_name, movie_url))
+                    return movie_details, False
+                return movie_details, True
+            
+            movies_processed, movies_added = await self._scrape_all(
+                movies_csv_file, output_file,
+                produce=pending_movies,
+                scrape_one=scrape_movie,
+                add_bulk=self.db_client.add_movies_bulk,
+                columns=MOVIE_DETAIL_COLUMNS,
+                label='movie'
+            )
+            
+            # List movies that could not be scraped (and clear a stale list from an earlier run)
+            if failed_movies:
+                await asyncio.to_thread(self._write_csv_sync, failed_file, ['name', 'url'], failed_movies)
+            elif os.path.exists(failed_file):
+                os.remove(failed_file)
             
             logger.info(f"Movie processing complete:")
             logger.info(f"  - Movies processed: {movies_processed}")
             logger.info(f"  - Movies skipped (already in DB): {movies_skipped}")
             logger.info(f"  - Movies added to DB: {movies_added}")
+            logger.info(f"  - Movies failed (listed in {failed_file}): {len(failed_movies)}")
             logger.info(f"Successfully saved detailed movie information to {output_file}")
             
         except Exception as e:
@@ -1168,7 +2350,11 @@ class MovieScraper:
     async def scrape_all_cinema_details(self, cinemas_csv_file: str = "cinemas.csv", output_file: str = "cinemas_details.csv"):
         """
         Scrape details for all cinemas from CSV file
-        Scrape first, then check database and add if not exists
+        Scrape first, then add to database unless a cinema with the same name exists
+        
+        Cinemas are streamed from the input and scraped concurrently on separate tabs
+        (pool_size workers). Cinemas already in the in-memory name -> ID map are not
+        sent to the database; the insert also skips existing names (ON CONFLICT DO NOTHING).
         
         Args:
             cinemas_csv_file: Input CSV file with cinemas
@@ -1176,147 +2362,188 @@ class MovieScraper:
         """
         try:
             logger.info(f"Scraping details for all cinemas from {cinemas_csv_file}")
-            
-            # Read cinemas from CSV
-            cinemas = []
-            with open(cinemas_csv_file, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile, delimiter='|')
-                for row in reader:
-                    cinemas.append((row['name'], row['url']))
-            
-            logger.info(f"Found {len(cinemas)} cinemas to process")
-            
-            # Create output CSV with header
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, delimiter='|')
-                writer.writerow(['name', 'url', 'address'])
-                csvfile.flush()  # Ensure header is written immediately
-            
-            # Process each cinema and append immediately
-            cinemas_processed = 0
             cinemas_skipped = 0
-            cinemas_added = 0
+            cinemas_failed = 0
+            cinemas_to_insert = 0
             
-            for i, (cinema_name, cinema_url) in enumerate(cinemas, 1):
-                logger.info(f"Processing cinema {i}/{len(cinemas)}: {cinema_name}")
-                
-                # First, scrape the cinema details (navigate to URL and get address)
+            async def pending_cinemas(pairs):
+                for pair in pairs:
+                    yield pair
+            
+            async def scrape_cinema(cinema_name: str, cinema_url: str):
+                # Scrape the cinema details (navigate to URL, get address and showtimes)
+                nonlocal cinemas_skipped, cinemas_failed, cinemas_to_insert
                 cinema_details = await self.scrape_cinema_details(cinema_name, cinema_url)
                 
-                # After scraping, check if cinema exists in database
-                if self.db_client.cinema_exists(cinema_name):
-                    logger.info(f"Cinema '{cinema_name}' already exists in database, skipping database add...")
+                # A failed scrape is still written to the CSV but its error text is not stored as an address
+                if cinema_details.get(FAILED_KEY):
+                    cinemas_failed += 1
+                    return cinema_details, False
+                if await self._lookup_id('cinemas', cinema_name):
                     cinemas_skipped += 1
-                else:
-                    # Cinema doesn't exist, add to database
-                    logger.info(f"Cinema '{cinema_name}' not found in database, adding...")
-                    
-                    # Prepare cinema data for database
-                    cinema_data = {
-                        'name': cinema_details['name'],
-                        'url': cinema_details['url'],
-                        'address': cinema_details['address']
-                    }
-                    
-                    # Add cinema to database
-                    cinema_id = self.db_client.add_cinema(cinema_data)
-                    if cinema_id:
-                        cinemas_added += 1
-                    else:
-                        logger.error(f"Failed to add cinema '{cinema_name}' to database")
-                
-                # Always append to CSV regardless of database status
-                with open(output_file, 'a', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile, delimiter='|')
-                    writer.writerow([
-                        cinema_details['name'],
-                        cinema_details['url'],
-                        cinema_details['address']
-                    ])
-                    csvfile.flush()  # Ensure data is written to disk immediately
-                
-                cinemas_processed += 1
-                
-                # Small delay between requests to be respectful
-                await asyncio.sleep(1)
+                    return cinema_details, False
+                cinemas_to_insert += 1
+                return cinema_details, True
+            
+            cinemas_processed, cinemas_added = await self._scrape_all(
+                cinemas_csv_file, output_file,
+                produce=pending_cinemas,
+                scrape_one=scrape_cinema,
+                add_bulk=self.db_client.add_cinemas_bulk,
+                columns=CINEMA_DETAIL_COLUMNS,
+                label='cinema'
+            )
             
             logger.info(f"Cinema processing complete:")
             logger.info(f"  - Cinemas processed: {cinemas_processed}")
             logger.info(f"  - Cinemas skipped (already in DB): {cinemas_skipped}")
             logger.info(f"  - Cinemas added to DB: {cinemas_added}")
+            logger.info(f"  - Cinemas not added (insert failed or name conflict): {cinemas_to_insert - cinemas_added}")
+            logger.info(f"  - Cinemas failed to scrape: {cinemas_failed}")
             logger.info(f"Successfully saved detailed cinema information to {output_file}")
             
         except Exception as e:
             logger.error(f"Error scraping cinema details: {e}")
 
 
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_session_loop_lock = threading.Lock()
+
+
+def _get_session_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop shared by all MovieScraperSync sessions, starting it on first use
+    
+    The loop runs for the life of the process in a daemon thread, so pooled browsers
+    (whose CDP connections are bound to it) survive from one session to the next,
+    e.g. between scheduled runs. Managed by hand, as asyncio.Runner needs Python 3.11.
+    
+    Returns:
+        Running event loop
+    """
+    global _session_loop
+    with _session_loop_lock:
+        if _session_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name='movie-scraper-loop', daemon=True)
+            thread.start()
+            atexit.register(_close_session_loop, loop, thread)
+            _session_loop = loop
+        return _session_loop
+
+
+def _close_session_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread):
+    """Stop the pooled browsers and the shared session loop at interpreter exit"""
+    try:
+        asyncio.run_coroutine_threadsafe(_BrowserPool.instance().close_idle(), loop).result(timeout=60)
+    except Exception as e:
+        logger.warning(f"Could not stop pooled browsers: {e}")
+    
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+    if not thread.is_alive():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def _create_task(coro) -> asyncio.Task:
+    """Wrap a coroutine in a task on the running loop"""
+    return asyncio.ensure_future(coro)
+
+
 # Synchronous wrapper for easier integration
 class MovieScraperSync:
     """Synchronous wrapper for the async MovieScraper"""
     
-    def __init__(self, headless: bool = True, delay: float = 2):
+    def __init__(self, headless: bool = True, delay: float = 2, pool_size: int = MAX_CONCURRENT_REQUESTS):
         self.headless = headless
         self.delay = delay
+        self.pool_size = pool_size
         self.scraper = None
         self.loop = None
     
     def __enter__(self):
         """Context manager entry"""
-        # Create new event loop for sync usage
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        # The browser's CDP connection is bound to one event loop, so every call runs
+        # on the process-wide session loop, which keeps pooled browsers across sessions
+        self.loop = _get_session_loop()
         
         # Initialize and setup scraper
-        self.scraper = MovieScraper(self.headless, self.delay)
-        self.loop.run_until_complete(self.scraper._setup_browser())
+        self.scraper = MovieScraper(self.headless, self.delay, self.pool_size)
+        self._run(self.scraper._setup_browser())
         
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        if self.scraper:
-            self.loop.run_until_complete(self.scraper.close())
         if self.loop:
-            self.loop.close()
+            try:
+                if self.scraper:
+                    # The browser goes back to the pool for the next session
+                    self._run(self.scraper.close())
+            finally:
+                self.loop = None
+    
+    def _run(self, coro):
+        """
+        Run a coroutine to completion on the session loop and wait for it
+        
+        On Ctrl+C the coroutine is cancelled and allowed to finish its cleanup
+        before KeyboardInterrupt is raised, as asyncio.run would do.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            Result of the coroutine
+        """
+        task = asyncio.run_coroutine_threadsafe(_create_task(coro), self.loop).result()
+        try:
+            asyncio.run_coroutine_threadsafe(asyncio.wait({task}), self.loop).result()
+        except KeyboardInterrupt:
+            self.loop.call_soon_threadsafe(task.cancel)
+            asyncio.run_coroutine_threadsafe(asyncio.wait({task}), self.loop).result()
+            raise
+        return task.result()
     
     def navigate_to_homepage(self) -> bool:
         """Navigate to homepage (sync version)"""
         if not self.scraper:
             return False
-        return self.loop.run_until_complete(self.scraper.navigate_to_homepage())
+        return self._run(self.scraper.navigate_to_homepage())
     
     def scrape_movie_showings(self) -> List[Tuple[str, str]]:
         """Scrape movie showings (sync version)"""
         if not self.scraper:
             return []
-        return self.loop.run_until_complete(self.scraper.scrape_movie_showings())
+        return self._run(self.scraper.scrape_movie_showings())
     
     def save_movies_to_csv(self, movies: List[Tuple[str, str]], filename: str = "movies.csv"):
         """Save movies to CSV (sync version)"""
         if not self.scraper:
             return
-        return self.loop.run_until_complete(self.scraper.save_movies_to_csv(movies, filename))
+        return self._run(self.scraper.save_movies_to_csv(movies, filename))
     
     def scrape_cinemas(self) -> List[Tuple[str, str]]:
         """Scrape cinemas (sync version)"""
         if not self.scraper:
             return []
-        return self.loop.run_until_complete(self.scraper.scrape_cinemas())
+        return self._run(self.scraper.scrape_cinemas())
     
     def save_cinemas_to_csv(self, cinemas: List[Tuple[str, str]], filename: str = "cinemas.csv"):
         """Save cinemas to CSV (sync version)"""
         if not self.scraper:
             return
-        return self.loop.run_until_complete(self.scraper.save_cinemas_to_csv(cinemas, filename))
+        return self._run(self.scraper.save_cinemas_to_csv(cinemas, filename))
     
-    def scrape_all_movie_details(self, movies_csv_file: str = "movies.csv", output_file: str = "movies_details.csv"):
+    def scrape_all_movie_details(self, movies_csv_file: str = "movies.csv", output_file: str = "movies_details.csv", failed_file: str = "movies_failed.csv"):
         """Scrape all movie details (sync version) - checks database before scraping"""
         if not self.scraper:
             return
-        return self.loop.run_until_complete(self.scraper.scrape_all_movie_details(movies_csv_file, output_file))
+        return self._run(self.scraper.scrape_all_movie_details(movies_csv_file, output_file, failed_file))
     
     def scrape_all_cinema_details(self, cinemas_csv_file: str = "cinemas.csv", output_file: str = "cinemas_details.csv"):
         """Scrape all cinema details (sync version) - scrapes first, then adds to database if not exists"""
         if not self.scraper:
             return
-        return self.loop.run_until_complete(self.scraper.scrape_all_cinema_details(cinemas_csv_file, output_file)) 
\ No newline at end of file
+        return self._run(self.scraper.scrape_all_cinema_details(cinemas_csv_file, output_file))
@@ -6,20 +6,22 @@ Run this to check if all dependencies and environment variables are properly con
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from dotenv import load_dotenv, find_dotenv
 
+# Environment variables checked by test_environment
+REQUIRED_VARS = ('SUPABASE_URL', 'SUPABASE_KEY')
+OPTIONAL_VARS = ('SUPABASE_SERVICE_KEY', "SUPABASE_SCHEMA", 'SCRAPER_DELAY', 'HEADLESS_MODE', 'NO_SANDBOX', 'SCRAPER_TIMEOUT', 'SCRAPER_POOL_SIZE', 'SCRAPER_RATE_LIMIT', 'BROWSER_POOL_MIN_IDLE', 'BROWSER_POOL_MAX_IDLE', 'BROWSER_POOL_MAX_IDLE_SECONDS')
+
+
 def test_environment():
     """Test environment variables."""
     print("🔍 Testing environment variables...")
     
-    load_dotenv(find_dotenv())
-    
-    required_vars = ['SUPABASE_URL', 'SUPABASE_KEY']
-    optional_vars = ['SUPABASE_SERVICE_KEY', "SUPABASE_SCHEMA", 'SCRAPER_DELAY', 'HEADLESS_MODE', 'NO_SANDBOX', 'SCRAPER_TIMEOUT']
-    
     missing_required = []
     
-    for var in required_vars:
+    for var in REQUIRED_VARS:
         value = os.getenv(var)
         if value:
             print(f"  ✅ {var}: {'*' * min(len(value), 20)}...")
@@ -27,7 +29,7 @@ def test_environment():
             print(f"  ❌ {var}: Missing")
             missing_required.append(var)
     
-    for var in optional_vars:
+    for var in OPTIONAL_VARS:
         value = os.getenv(var)
         if value:
             print(f"  ✅ {var}: {value}")
@@ -81,43 +83,58 @@ def test_imports():
     return True
 
 
-def test_zendriver():
-    """Test Zendriver setup."""
+def check_browser():
+    """
+    Start a headless browser and load a page.
+    
+    Returns:
+        Tuple of (success, page title or error message)
+    """
+    import zendriver as zd
+    import asyncio
+    
+    async def test_browser():
+        """Test basic browser functionality."""
+        browser = None
+        try:
+            # Read NO_SANDBOX from environment
+            no_sandbox = os.getenv('NO_SANDBOX', 'false').lower() in ('true', '1', 'yes', 'on')
+            
+            # Start browser with minimal config
+            browser = await zd.start(headless=True, no_sandbox=no_sandbox)
+            
+            # Get a page and navigate to a simple site
+            page = await browser.get("https://www.google.com")
+            
+            # Get the page title
+            title = await page.evaluate("document.title")
+            
+            return True, title
+            
+        except Exception as e:
+            return False, str(e)
+        finally:
+            if browser:
+                try:
+                    await browser.stop()
+                except:
+                    pass
+    
+    return asyncio.run(test_browser())
+
+
+def test_zendriver(browser_check=None):
+    """
+    Test Zendriver setup.
+    
+    Args:
+        browser_check: Future of a check_browser() call already running in the background (optional)
+    """
     print("\n🔍 Testing Zendriver...")
     
     try:
-        import zendriver as zd
-        import asyncio
-        
-        async def test_browser():
-            """Test basic browser functionality."""
-            browser = None
-            try:
-                # Read NO_SANDBOX from environment
-                no_sandbox = os.getenv('NO_SANDBOX', 'false').lower() in ('true', '1', 'yes', 'on')
-                
-                # Start browser with minimal config
-                browser = await zd.start(headless=True, no_sandbox=no_sandbox)
-                
-                # Get a page and navigate to a simple site
-                page = await browser.get("https://www.google.com")
-                
-                # Get the page title
-                title = await page.evaluate("document.title")
-                
-                return True, title
-                
-            except Exception as e:
-                return False, str(e)
-            finally:
-                if browser:
-                    try:
-                        await browser.stop()
-                    except:
-                        pass
-        
-        # Run the test
-        success, result = asyncio.run(test_browser())
+        # Run the test (or wait for the one started by main)
+        success, result = browser_check.result() if browser_check else check_browser()
         
         if success:
             print(f"  ✅ Zendriver test successful (navigated to Google: '{result}')")
@@ -181,10 +198,18 @@ def main():
     print("🧪 Movie Scraper Setup Test")
     print("=" * 40)
     
+    # Launching the browser dominates the run time, so it starts in the background while
+    # the other tests run; its result is still reported in order. The .env file is loaded
+    # once, here, before it starts reading NO_SANDBOX.
+    load_dotenv(find_dotenv())
+    executor = ThreadPoolExecutor(max_workers=1)
+    browser_check = executor.submit(check_browser)
+    executor.shutdown(wait=False)
+    
     tests = [
         test_environment,
         test_imports,
-        test_zendriver,
+        partial(test_zendriver, browser_check),
         test_database_connection,
         test_scraper_initialization
     ]
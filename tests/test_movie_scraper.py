@@ -0,0 +1,184 @@
+"""
+Tests for the pure helpers of the movie scraper.
+"""
+import asyncio
+import csv
+import io
+import os
+import sys
+import unittest
+from datetime import date, datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The scraper creates a database client on init; it makes no requests until used
+os.environ.setdefault('SUPABASE_URL', 'https://example.supabase.co')
+os.environ.setdefault('SUPABASE_KEY', 'test.test.test')
+
+from scraper.movie_scraper import MovieScraper, _TokenBucket
+
+
+class FakeShowtimeDatabase:
+    """Stands in for SupabaseClient in the showtime saving tests"""
+    
+    def __init__(self, upcoming, stored_limit=None):
+        self.upcoming = upcoming
+        self.stored_limit = stored_limit
+        self.inserted = []
+    
+    def get_upcoming_showtimes(self, since):
+        return set(self.upcoming)
+    
+    def add_showtimes_bulk(self, rows):
+        # Store only the first stored_limit rows, like a partially failed insert
+        stored = rows[:self.stored_limit] if self.stored_limit is not None else rows
+        self.inserted.append(rows)
+        return {(row['cinema_id'], row['movie_id'], datetime.fromisoformat(row['showtime']), row['language']) for row in stored}
+
+
+def showtime_row(movie_id, showtime, language='English', cinema_id='c1'):
+    return {'movie_id': movie_id, 'cinema_id': cinema_id, 'showtime': showtime, 'language': language}
+
+
+class FormatCsvRowTest(unittest.TestCase):
+    """Tests for _format_csv_row"""
+    
+    def setUp(self):
+        self.scraper = MovieScraper()
+    
+    def assert_matches_csv_writer(self, row):
+        expected = io.StringIO()
+        csv.writer(expected, delimiter='|').writerow(row)
+        self.assertEqual(self.scraper._format_csv_row(row), expected.getvalue())
+    
+    def test_plain_fields(self):
+        self.assert_matches_csv_writer(['Dune', 'https://hkmovie6.com/movie/1', 'Sci-Fi', 'A desert planet'])
+    
+    def test_fields_needing_quotes(self):
+        self.assert_matches_csv_writer(['A | B', 'say "hi"', 'line\nbreak', 'carriage\rreturn'])
+    
+    def test_empty_and_non_string_fields(self):
+        self.assert_matches_csv_writer(['', 'name', 3])
+    
+    def test_round_trips_through_reader(self):
+        row = ['The "Best" | Film', 'https://hkmovie6.com/movie/2']
+        parsed = next(csv.reader(io.StringIO(self.scraper._format_csv_row(row)), delimiter='|'))
+        self.assertEqual(parsed, row)
+
+
+class ParseDateTextTest(unittest.TestCase):
+    """Tests for _parse_date_text"""
+    
+    def setUp(self):
+        self.scraper = MovieScraper()
+    
+    def test_date_later_this_year(self):
+        self.assertEqual(self.scraper._parse_date_text('15/12', date(2026, 10, 16)), date(2026, 12, 15))
+    
+    def test_today_stays_in_this_year(self):
+        self.assertEqual(self.scraper._parse_date_text('16/10', date(2026, 10, 16)), date(2026, 10, 16))
+    
+    def test_rolls_over_to_next_year(self):
+        self.assertEqual(self.scraper._parse_date_text('2/1', date(2026, 12, 30)), date(2027, 1, 2))
+    
+    def test_allows_whitespace(self):
+        self.assertEqual(self.scraper._parse_date_text(' 5 / 11 ', date(2026, 10, 16)), date(2026, 11, 5))
+    
+    def test_invalid_day(self):
+        self.assertIsNone(self.scraper._parse_date_text('31/2', date(2026, 1, 1)))
+    
+    def test_not_a_date(self):
+        self.assertIsNone(self.scraper._parse_date_text('Today', date(2026, 10, 16)))
+        self.assertIsNone(self.scraper._parse_date_text('15/12/2026', date(2026, 10, 16)))
+
+
+class TokenBucketTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for _TokenBucket"""
+    
+    async def test_burst_is_immediate_then_waits(self):
+        bucket = _TokenBucket(10, burst=3)
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        for _ in range(3):
+            await bucket.acquire()
+        self.assertLess(loop.time() - start, 0.05)
+        
+        await bucket.acquire()
+        self.assertGreaterEqual(loop.time() - start, 0.09)
+    
+    async def test_no_rate_never_waits(self):
+        bucket = _TokenBucket(None)
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        for _ in range(100):
+            await bucket.acquire()
+        self.assertLess(loop.time() - start, 0.05)
+    
+    def test_slow_down_halves_rate_down_to_a_floor(self):
+        bucket = _TokenBucket(16)
+        bucket.slow_down()
+        self.assertEqual(bucket.rate, 8)
+        for _ in range(10):
+            bucket.slow_down()
+        self.assertEqual(bucket.rate, 1)
+    
+    def test_speed_up_recovers_to_configured_rate(self):
+        bucket = _TokenBucket(10)
+        bucket.slow_down()
+        bucket.speed_up()
+        self.assertEqual(bucket.rate, 6)
+        for _ in range(10):
+            bucket.speed_up()
+        self.assertEqual(bucket.rate, 10)
+
+
+class SaveShowtimesTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for _save_showtimes"""
+    
+    def make_scraper(self, database):
+        scraper = MovieScraper()
+        scraper.db_client = database
+        return scraper
+    
+    async def test_skips_stored_and_duplicate_showtimes(self):
+        database = FakeShowtimeDatabase({('c1', 'm1', datetime(2026, 10, 16, 12, 30), 'English')})
+        scraper = self.make_scraper(database)
+        
+        await scraper._save_showtimes('c1', 'Cinema', [
+            showtime_row('m1', '2026-10-16T12:30:00'),
+            showtime_row('m1', '2026-10-16T15:00:00'),
+            showtime_row('m1', '2026-10-16T15:00:00'),
+            showtime_row('m1', '2026-10-16T15:00:00', language='Cantonese'),
+        ])
+        
+        self.assertEqual(database.inserted, [[
+            showtime_row('m1', '2026-10-16T15:00:00'),
+            showtime_row('m1', '2026-10-16T15:00:00', language='Cantonese'),
+        ]])
+    
+    async def test_second_save_inserts_nothing(self):
+        database = FakeShowtimeDatabase(set())
+        scraper = self.make_scraper(database)
+        rows = [showtime_row('m1', '2026-10-16T12:30:00'), showtime_row('m2', '2026-10-16T12:30:00')]
+        
+        await scraper._save_showtimes('c1', 'Cinema', rows)
+        await scraper._save_showtimes('c1', 'Cinema', rows)
+        
+        self.assertEqual(len(database.inserted), 1)
+    
+    async def test_partial_insert_indexes_only_stored_rows(self):
+        database = FakeShowtimeDatabase(set(), stored_limit=1)
+        scraper = self.make_scraper(database)
+        rows = [showtime_row('m1', '2026-10-16T12:30:00'), showtime_row('m2', '2026-10-16T12:30:00')]
+        
+        await scraper._save_showtimes('c1', 'Cinema', rows)
+        database.stored_limit = None
+        await scraper._save_showtimes('c1', 'Cinema', rows)
+        
+        self.assertEqual(database.inserted[1], [showtime_row('m2', '2026-10-16T12:30:00')])
+
+
+if __name__ == '__main__':
+    unittest.main()
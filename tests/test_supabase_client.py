@@ -0,0 +1,48 @@
+"""
+Tests for the pure helpers of the Supabase client.
+"""
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.supabase_client import SupabaseClient, _in_filter_list
+
+
+class InFilterListTest(unittest.TestCase):
+    """Tests for _in_filter_list"""
+    
+    def test_quotes_every_value(self):
+        self.assertEqual(_in_filter_list(['Dune', 'Up']), '("Dune","Up")')
+    
+    def test_keeps_reserved_characters_inside_quotes(self):
+        self.assertEqual(_in_filter_list(['Hello, World (2024)']), '("Hello, World (2024)")')
+    
+    def test_escapes_double_quotes(self):
+        self.assertEqual(_in_filter_list(['The "Best" Film']), '("The \\"Best\\" Film")')
+    
+    def test_escapes_backslashes_before_quotes(self):
+        # A trailing backslash must not escape the closing quote
+        self.assertEqual(_in_filter_list(['AC\\', 'DC']), '("AC\\\\","DC")')
+    
+    def test_empty_list(self):
+        self.assertEqual(_in_filter_list([]), '()')
+
+
+class AddShowtimesBulkTest(unittest.TestCase):
+    """Tests for add_showtimes_bulk"""
+    
+    def test_returns_keys_of_inserted_rows(self):
+        client = SupabaseClient.__new__(SupabaseClient)
+        stored = [{'id': '1', 'cinema_id': 'c1', 'movie_id': 'm1', 'showtime': '2026-10-16T12:30:00+00:00', 'language': 'English'}]
+        client._add_many = lambda table_name, rows, on_conflict=None: stored
+        
+        keys = client.add_showtimes_bulk([{}, {}])
+        
+        self.assertEqual(keys, {('c1', 'm1', datetime(2026, 10, 16, 12, 30), 'English')})
+
+
+if __name__ == '__main__':
+    unittest.main()